@@ -4,6 +4,7 @@ Dead Horizon - A Zombie Apocalypse Survival Roguelike
 Main entry point
 """
 
+import itertools
 import os
 import sys
 from pathlib import Path
@@ -19,6 +20,51 @@ from src.ui.title_screen import TitleScreen, MenuState
 from src.ui.character_creation import CharacterCreation, CreationState
 
 
+def run_scene(scene, is_done, root_console: tcod.console.Console, context: tcod.context.Context) -> None:
+    """Render a menu scene and feed it events until is_done() returns True."""
+    while not is_done():
+        root_console.clear()
+        scene.render(root_console)
+        context.present(root_console)
+
+        for event in tcod.event.wait():
+            context.convert_event(event)
+
+            if isinstance(event, tcod.event.Quit):
+                raise SystemExit()
+
+            scene.handle_event(event)
+
+
+def run_game(game: Game, root_console: tcod.console.Console, context: tcod.context.Context) -> None:
+    """Run the main game loop, redrawing only when the game state changed."""
+    while True:
+        # Turn-based: nothing moves between inputs, so skip static frames
+        if game.needs_render:
+            root_console.clear()
+            game.render(root_console)
+            context.present(root_console)
+            game.needs_render = False
+
+        # Block for the next event, then drain whatever else queued up behind
+        # it so a burst of input (or mouse motion) costs a single redraw
+        for event in itertools.chain(tcod.event.wait(), tcod.event.get()):
+            context.convert_event(event)
+
+            if isinstance(event, tcod.event.Quit):
+                raise SystemExit()
+
+            # Window exposed/resized - present the frame again
+            if isinstance(event, tcod.event.WindowEvent):
+                game.needs_render = True
+
+            # Handle input
+            action = game.handle_event(event)
+
+            if action == "quit":
+                raise SystemExit()
+
+
 def main() -> None:
     """Main entry point for Dead Horizon."""
 
@@ -64,18 +110,12 @@ def main() -> None:
         title_screen = TitleScreen(screen_width, screen_height)
 
         # Title screen / menu loop
-        while title_screen.state not in (MenuState.PLAYING, MenuState.CONTINUE, MenuState.QUIT):
-            root_console.clear()
-            title_screen.render(root_console)
-            context.present(root_console)
-
-            for event in tcod.event.wait():
-                context.convert_event(event)
-
-                if isinstance(event, tcod.event.Quit):
-                    raise SystemExit()
-
-                title_screen.handle_event(event)
+        run_scene(
+            title_screen,
+            lambda: title_screen.state in (MenuState.PLAYING, MenuState.CONTINUE, MenuState.QUIT),
+            root_console,
+            context,
+        )
 
         # Check if user quit from menu
         if title_screen.state == MenuState.QUIT:
@@ -101,18 +141,12 @@ def main() -> None:
             # === NEW GAME - CHARACTER CREATION ===
             char_creation = CharacterCreation(screen_width, screen_height)
 
-            while char_creation.state != CreationState.DONE:
-                root_console.clear()
-                char_creation.render(root_console)
-                context.present(root_console)
-
-                for event in tcod.event.wait():
-                    context.convert_event(event)
-
-                    if isinstance(event, tcod.event.Quit):
-                        raise SystemExit()
-
-                    char_creation.handle_event(event)
+            run_scene(
+                char_creation,
+                lambda: char_creation.state == CreationState.DONE,
+                root_console,
+                context,
+            )
 
             # Get the configured character
             player_name, player_stats = char_creation.get_player_stats()
@@ -129,28 +163,7 @@ def main() -> None:
             )
 
         # Main game loop
-        while True:
-            # Clear the console
-            root_console.clear()
-
-            # Render the game
-            game.render(root_console)
-
-            # Present the console to the screen
-            context.present(root_console)
-
-            # Handle events
-            for event in tcod.event.wait():
-                context.convert_event(event)
-
-                if isinstance(event, tcod.event.Quit):
-                    raise SystemExit()
-
-                # Handle input
-                action = game.handle_event(event)
-
-                if action == "quit":
-                    raise SystemExit()
+        run_game(game, root_console, context)
 
 
 if __name__ == "__main__":
@@ -4,28 +4,138 @@ Game engine - Main game class that orchestrates everything
 
 from __future__ import annotations
 
+import bisect
+import itertools
+import operator
 import random
-from typing import TYPE_CHECKING
+from collections import deque
+from typing import TYPE_CHECKING, Callable
 
+import numpy as np
 import tcod.console
 import tcod.event
 
 from src.entities.entity import Entity
 from src.entities.player import Player, PlayerStats
-from src.entities.monster import Monster, ZombieType
+from src.entities.monster import CHASE_RANGE, Monster, ZombieType
 from src.map.game_map import GameMap
 from src.map.procgen import generate_dungeon
 from src.engine.input_handler import handle_keys
 from src.systems.combat import Combat, AttackResult
 from src.systems.survival import Survival
-from src.graphics.effects import EffectsManager
-from src.items.item import Item, get_random_item, create_item
+from src.graphics.effects import BLOOD_CHAR_LUT, BLOOD_COLOR_LUT, EffectsManager
+from src.items.item import ITEMS, Item, get_random_item, create_item
 from src.ui.inventory_screen import InventoryScreen
 from src.ui.pickup_screen import PickupScreen
 
 if TYPE_CHECKING:
     from src.graphics.tileset_manager import TilesetManager
 
+# Message log capacity
+MAX_MESSAGES = 100
+
+# Spawn distribution: more basic zombies, fewer special types
+_ZOMBIE_TYPES = (
+    ZombieType.ZOMBIE,
+    ZombieType.FAST,
+    ZombieType.CRAWLER,
+    ZombieType.SKELETON,
+    ZombieType.BRUTE,
+)
+_ZOMBIE_WEIGHTS = np.array([40, 20, 15, 15, 10], dtype=np.float64)
+_ZOMBIE_CDF = np.cumsum(_ZOMBIE_WEIGHTS) / _ZOMBIE_WEIGHTS.sum()
+
+# Pause menu border colour
+_BORDER_FG = (80, 80, 100)
+
+# UI panel colours
+_NAME_FG = (255, 255, 255)
+_HP_FG = (255, 100, 100)
+_HP_BAR_FG = (255, 50, 50)
+_XP_FG = (100, 200, 255)
+_HUNGER_FG = (200, 180, 100)
+_THIRST_FG = (100, 180, 200)
+_ATK_FG = (255, 180, 100)
+_DEF_FG = (100, 180, 255)
+_CRIT_FG = (255, 255, 100)
+_KILLS_FG = (255, 100, 100)
+_ENEMIES_FG = (100, 200, 100)
+_ITEMS_FG = (200, 200, 100)
+
+# UI bar tracks as (x, panel row, width), shared by the static panel and the fills
+_HP_BAR = (1, 3, 20)
+_XP_BAR = (25, 2, 15)
+_HUNGER_BAR = (40, 3, 8)
+_THIRST_BAR = (65, 3, 8)
+
+# Sort key for drawing entities back to front
+_RENDER_ORDER = operator.attrgetter("render_order")
+
+# Item id by display name, for recreating dropped items
+_ITEM_IDS_BY_NAME = {item_def.name: item_id for item_id, item_def in ITEMS.items()}
+
+
+def _gather_visible(
+    mask: np.ndarray, xs: np.ndarray, ys: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Cull a batch of map positions against a boolean [x, y] mask.
+
+    Returns the indices of the positions whose mask cell is set, along with their
+    x and y coordinates, ready for one fancy-indexed store into console.rgb.
+    """
+    sel = np.flatnonzero(mask[xs, ys])
+    return sel, xs[sel], ys[sel]
+
+
+def _fill_bar(
+    cells: np.ndarray, x: int, y: int, length: int, ch: int, fg: tuple[int, int, int]
+) -> None:
+    """Write the filled part of a one-row UI bar straight into console.rgb."""
+    if length > 0:
+        cells["ch"][x:x + length, y] = ch
+        cells["fg"][x:x + length, y] = fg
+
+
+def _random_room_tiles(
+    rng: np.random.Generator, rooms_arr: np.ndarray, room_indices: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Draw one random interior tile in each of the given rooms at once.
+
+    rooms_arr is an (R, 4) array of room bounds (x1, y1, x2, y2). Returns parallel
+    xs and ys arrays, one entry per index in room_indices.
+    """
+    picks = rooms_arr[room_indices]
+    xs = rng.integers(picks[:, 0] + 1, picks[:, 2])
+    ys = rng.integers(picks[:, 1] + 1, picks[:, 3])
+    return xs, ys
+
+
+def _pick_spawn_positions(
+    rng: np.random.Generator,
+    rooms_arr: np.ndarray,
+    walkable: np.ndarray,
+    occupied: np.ndarray,
+    count: int,
+) -> np.ndarray:
+    """
+    Draw `count` spawn attempts at once: a random room, then a random tile inside it.
+
+    rooms_arr is an (R, 4) array of room bounds (x1, y1, x2, y2). Attempts that land
+    on an unwalkable or occupied tile, or on a tile an earlier attempt already took,
+    are dropped. Returns an (N, 2) int32 array of (x, y) positions with N <= count.
+    """
+    xs, ys = _random_room_tiles(rng, rooms_arr, rng.integers(len(rooms_arr), size=count))
+
+    # Keep only the first attempt on each tile
+    _, first = np.unique(xs * walkable.shape[1] + ys, return_index=True)
+    is_first = np.zeros(count, dtype=bool)
+    is_first[first] = True
+
+    keep = is_first & walkable[xs, ys] & ~occupied[xs, ys]
+    return np.stack((xs[keep], ys[keep]), axis=1).astype(np.int32)
+
 
 class GameState:
     """Game state enum."""
@@ -48,6 +158,7 @@ class Game:
         tileset_manager: TilesetManager | None = None,
         player_name: str = "Survivor",
         player_stats: PlayerStats | None = None,
+        seed: int | None = None,
     ) -> None:
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -60,14 +171,36 @@ class Game:
         # UI dimensions
         self.ui_height = screen_height - map_height
 
+        # Game-owned RNGs for the map, spawns, loot and blood; a fixed seed reproduces them.
+        # Without one, the seed comes from the global random module, so random.seed still works.
+        self.rng = random.Random(seed if seed is not None else random.getrandbits(64))
+        self._np_rng = np.random.default_rng(self.rng.getrandbits(64))
+
         # Visual effects manager
-        self.effects = EffectsManager()
+        self.effects = EffectsManager(self._np_rng)
 
         # Entity list
         self.entities: list[Entity] = []
 
-        # Items on the ground
+        # Entities sorted by render order (stable), kept in step with self.entities
+        # by _add_entity/_remove_entity; _render_keys holds each one's render_order
+        self._render_sorted: list[Entity] = []
+        self._render_keys: list[int] = []
+
+        # Blocking entities by position, for O(1) bump/collision checks
+        self._blocker_pos: dict[tuple[int, int], Entity] = {}
+
+        # Entities that take turns (every live monster), in spawn order
+        self._actors: list[Monster] = []
+        # Bound take_turn of each actor, parallel to _actors
+        self._take_turns: list[Callable[[Game], None]] = []
+
+        # Entities showing a damage flash, cleared at the start of the next move
+        self._flashing_entities: set[Entity] = set()
+
+        # Items on the ground, plus an (N, 2) array of the occupied positions
         self.ground_items: dict[tuple[int, int], list[Item]] = {}
+        self._ground_xy = np.empty((0, 2), dtype=np.int32)
 
         # Generate the map and place player
         self.game_map, player_x, player_y = generate_dungeon(
@@ -76,6 +209,7 @@ class Game:
             max_rooms=30,
             room_min_size=6,
             room_max_size=10,
+            rng=self.rng,
         )
 
         # Create the player with custom stats
@@ -86,7 +220,7 @@ class Game:
             stats=player_stats,
             tileset_manager=tileset_manager,
         )
-        self.entities.append(self.player)
+        self._add_entity(self.player)
 
         # Spawn zombies with variety
         self._spawn_zombies()
@@ -94,8 +228,14 @@ class Game:
         # Spawn items in rooms
         self._spawn_items()
 
+        # Derived UI values, recomputed only when their inputs change
+        self._ui_cache: dict = {}
+
+        # Pre-drawn UI panel parts that never change, blitted every frame
+        self._ui_static = self._build_ui_static()
+
         # Message log
-        self.messages: list[tuple[str, tuple[int, int, int]]] = []
+        self.messages: deque[tuple[str, tuple[int, int, int]]] = deque(maxlen=MAX_MESSAGES)
         self.add_message(f"Welcome, {player_name}. Survive the apocalypse!", (255, 255, 100))
         self.add_message("WASD/Arrows to move. I=Inventory, G=Pickup (Space to multi-select).", (200, 200, 200))
 
@@ -108,10 +248,13 @@ class Game:
         self.game_over = False
         self.pause_selection = 0  # For pause menu
 
-        # Inventory screen (created when opened)
+        # Inventory screen (created on first open, then reused)
         self.inventory_screen: InventoryScreen | None = None
         self.pickup_screen: PickupScreen | None = None
 
+        # Set when the next frame differs from the last one presented
+        self.needs_render = True
+
         # Initialize FOV with player's perception-based radius
         self.recompute_fov()
 
@@ -123,64 +266,110 @@ class Game:
 
     def _spawn_zombies(self, count: int = 12) -> None:
         """Spawn a variety of zombie types in random room positions."""
-        rooms = getattr(self.game_map, 'rooms', [])
-
-        # Spawn distribution: more basic zombies, fewer special types
-        zombie_weights = [
-            (ZombieType.ZOMBIE, 40),
-            (ZombieType.FAST, 20),
-            (ZombieType.CRAWLER, 15),
-            (ZombieType.SKELETON, 15),
-            (ZombieType.BRUTE, 10),
-        ]
-
-        types = [t for t, _ in zombie_weights]
-        weights = [w for _, w in zombie_weights]
-
-        for _ in range(count):
-            if rooms:
-                room = random.choice(rooms)
-                x = random.randint(room.x1 + 1, room.x2 - 1)
-                y = random.randint(room.y1 + 1, room.y2 - 1)
-            else:
-                x = random.randint(1, self.map_width - 2)
-                y = random.randint(1, self.map_height - 2)
-
-            if (x, y) != (self.player.x, self.player.y) and self.game_map.walkable[x, y]:
-                if not any(e.x == x and e.y == y for e in self.entities):
-                    zombie_type = random.choices(types, weights=weights, k=1)[0]
-                    zombie = Monster.spawn_zombie(
-                        x=x,
-                        y=y,
-                        zombie_type=zombie_type,
-                        tileset_manager=self.tileset_manager,
-                    )
-                    self.entities.append(zombie)
+        rooms = self.game_map.rooms
+
+        if rooms:
+            rooms_arr = np.array([(r.x1, r.y1, r.x2, r.y2) for r in rooms], dtype=np.int32)
+        else:
+            rooms_arr = np.array([(0, 0, self.map_width - 1, self.map_height - 1)], dtype=np.int32)
+
+        occupied = np.zeros((self.map_width, self.map_height), dtype=bool, order="F")
+        for x, y in self._blocker_pos:
+            occupied[x, y] = True
+
+        positions = _pick_spawn_positions(self._np_rng, rooms_arr, self.game_map.walkable, occupied, count)
+        # Inverse-CDF lookup: one uniform roll per zombie against the cumulative weights
+        type_indices = _ZOMBIE_CDF.searchsorted(self._np_rng.random(len(positions)), side="right")
+
+        for (x, y), type_index in zip(positions.tolist(), type_indices.tolist()):
+            zombie = Monster.spawn_zombie(
+                x=x,
+                y=y,
+                zombie_type=_ZOMBIE_TYPES[type_index],
+                tileset_manager=self.tileset_manager,
+            )
+            self._add_entity(zombie)
+
+    def _rebuild_entity_index(self) -> None:
+        """Rebuild position and render caches after self.entities was replaced wholesale."""
+        self._blocker_pos = {(e.x, e.y): e for e in self.entities if e.blocks}
+        self._actors = [e for e in self.entities if isinstance(e, Monster)]
+        self._take_turns = [actor.take_turn for actor in self._actors]
+        self._render_sorted = sorted(self.entities, key=_RENDER_ORDER)
+        self._render_keys = list(map(_RENDER_ORDER, self._render_sorted))
+
+    def _add_entity(self, entity: Entity) -> None:
+        """Add an entity to the world and to every index over it."""
+        self.entities.append(entity)
+        # Insert after equal keys so ties keep insertion order, like a stable sort
+        index = bisect.bisect_right(self._render_keys, entity.render_order)
+        self._render_keys.insert(index, entity.render_order)
+        self._render_sorted.insert(index, entity)
+        if entity.blocks:
+            self._blocker_pos[(entity.x, entity.y)] = entity
+        if isinstance(entity, Monster):
+            self._actors.append(entity)
+            self._take_turns.append(entity.take_turn)
+
+    def _remove_entity(self, entity: Entity) -> None:
+        """Remove an entity from the world and from every index over it."""
+        self.entities.remove(entity)
+        index = self._render_sorted.index(entity)
+        del self._render_keys[index]
+        del self._render_sorted[index]
+        if entity.blocks:
+            del self._blocker_pos[(entity.x, entity.y)]
+        if isinstance(entity, Monster):
+            index = self._actors.index(entity)
+            del self._actors[index]
+            del self._take_turns[index]
+
+    def move_entity(self, entity: Entity, x: int, y: int) -> None:
+        """Move an entity to (x, y), keeping the blocker index in sync."""
+        if entity.blocks:
+            del self._blocker_pos[(entity.x, entity.y)]
+            self._blocker_pos[(x, y)] = entity
+        entity.x = x
+        entity.y = y
+
+    def flash_entity(self, entity: Entity) -> None:
+        """Show a damage flash on an entity until the player's next move."""
+        entity.is_flashing = True
+        self._flashing_entities.add(entity)
+        self.effects.add_damage_flash(entity.x, entity.y)
 
     def _spawn_items(self) -> None:
         """Spawn items in dungeon rooms."""
-        rooms = getattr(self.game_map, 'rooms', [])
+        rooms = self.game_map.rooms
 
         # Skip the first room (player spawn)
-        for room in rooms[1:]:
-            # 60% chance to spawn 1-3 items in each room
-            if random.random() < 0.6:
-                num_items = random.randint(1, 3)
-                for _ in range(num_items):
-                    x = random.randint(room.x1 + 1, room.x2 - 1)
-                    y = random.randint(room.y1 + 1, room.y2 - 1)
-
-                    if self.game_map.walkable[x, y]:
-                        item = get_random_item()
-                        self._add_ground_item(x, y, item)
+        rooms = rooms[1:]
+        if not rooms:
+            return
+        rooms_arr = np.array([(r.x1, r.y1, r.x2, r.y2) for r in rooms], dtype=np.int32)
+
+        # 60% chance to spawn 1-3 items in each room, all rolled at once
+        counts = self._np_rng.integers(1, 4, size=len(rooms))
+        counts[self._np_rng.random(len(rooms)) >= 0.6] = 0
+        xs, ys = _random_room_tiles(self._np_rng, rooms_arr, np.repeat(np.arange(len(rooms)), counts))
+
+        keep = self.game_map.walkable[xs, ys]
+        for x, y in zip(xs[keep].tolist(), ys[keep].tolist()):
+            self._add_ground_item(x, y, get_random_item(self.rng))
 
     def _add_ground_item(self, x: int, y: int, item: Item) -> None:
         """Add an item to the ground at position."""
         key = (x, y)
         if key not in self.ground_items:
             self.ground_items[key] = []
+            self._ground_xy = np.append(self._ground_xy, [key], axis=0)
         self.ground_items[key].append(item)
 
+    def _clear_ground_items(self) -> None:
+        """Remove every item from the ground."""
+        self.ground_items = {}
+        self._ground_xy = np.empty((0, 2), dtype=np.int32)
+
     def _get_ground_items(self, x: int, y: int) -> list[Item]:
         """Get items on the ground at position."""
         return self.ground_items.get((x, y), [])
@@ -192,22 +381,26 @@ class Game:
             self.ground_items[key].remove(item)
             if not self.ground_items[key]:
                 del self.ground_items[key]
+                row = np.flatnonzero((self._ground_xy[:, 0] == x) & (self._ground_xy[:, 1] == y))
+                self._ground_xy = np.delete(self._ground_xy, row, axis=0)
             return True
         return False
 
     def add_message(self, text: str, color: tuple[int, int, int] = (255, 255, 255)) -> None:
         """Add a message to the log."""
-        self.messages.append((text, color))
-        if len(self.messages) > 100:
-            self.messages.pop(0)
+        self.messages.append((text, color))  # Oldest entry drops off at MAX_MESSAGES
+        self._ui_cache.pop("recent_msgs", None)
 
     def recompute_fov(self) -> None:
         """Recompute the field of view based on player position and perception."""
-        radius = getattr(self.player, 'fov_radius', 8)
-        self.game_map.compute_fov(self.player.x, self.player.y, radius=radius)
+        self.game_map.compute_fov(self.player.x, self.player.y, radius=self.player.fov_radius)
 
     def handle_event(self, event: tcod.event.Event) -> str | None:
         """Handle input events and return action if any."""
+        # Every game state change is driven by a key press
+        if isinstance(event, tcod.event.KeyDown):
+            self.needs_render = True
+
         # Handle inventory state
         if self.state == GameState.INVENTORY:
             return self._handle_inventory_event(event)
@@ -254,7 +447,11 @@ class Game:
 
         if action == "inventory":
             self.state = GameState.INVENTORY
-            self.inventory_screen = InventoryScreen(self.player)
+            # Reuse the screen across opens; the player may change on load
+            if self.inventory_screen is None:
+                self.inventory_screen = InventoryScreen(self.player)
+            else:
+                self.inventory_screen.reset(self.player)
             return None
 
         if action == "pickup":
@@ -287,19 +484,17 @@ class Game:
 
         if should_close:
             self.state = GameState.PLAYING
-            self.inventory_screen = None
             return None
 
         # Handle special results
         if result and result.startswith("DROP:"):
             item_name = result[5:]
             # Create a copy of the dropped item to place on ground
-            for item_id, item_def in __import__('src.items.item', fromlist=['ITEMS']).ITEMS.items():
-                if item_def.name == item_name:
-                    dropped_item = create_item(item_id)
-                    self._add_ground_item(self.player.x, self.player.y, dropped_item)
-                    self.add_message(f"Dropped {item_name}.", (200, 200, 100))
-                    break
+            item_id = _ITEM_IDS_BY_NAME.get(item_name)
+            if item_id is not None:
+                dropped_item = create_item(item_id)
+                self._add_ground_item(self.player.x, self.player.y, dropped_item)
+                self.add_message(f"Dropped {item_name}.", (200, 200, 100))
 
         return None
 
@@ -408,9 +603,9 @@ class Game:
         dest_x = self.player.x + dx
         dest_y = self.player.y + dy
 
-        self.player.is_flashing = False
-        for entity in self.entities:
+        for entity in self._flashing_entities:
             entity.is_flashing = False
+        self._flashing_entities.clear()
 
         if self.game_map.open_door(dest_x, dest_y):
             self.add_message("You open the door.", (200, 200, 150))
@@ -429,8 +624,7 @@ class Game:
             self.add_message(msg, color)
 
             if result != AttackResult.MISS:
-                target.is_flashing = True
-                self.effects.add_damage_flash(target.x, target.y)
+                self.flash_entity(target)
 
                 if damage > 0:
                     blood_amount = 1
@@ -450,11 +644,11 @@ class Game:
                     self.add_message(f"LEVEL UP! You are now level {self.player.level}!", (255, 255, 100))
                 self.add_message(f"The {target.name} is dead! (+{xp_gained} XP)", (255, 100, 100))
                 self.effects.add_death_blood(target.x, target.y)
-                self.entities.remove(target)
+                self._remove_entity(target)
 
                 # Chance to drop item on death
-                if random.random() < 0.3:
-                    drop = get_random_item()
+                if self.rng.random() < 0.3:
+                    drop = get_random_item(self.rng)
                     self._add_ground_item(target.x, target.y, drop)
                     self.add_message(f"The {target.name} dropped {drop.name}!", (200, 200, 100))
 
@@ -466,8 +660,7 @@ class Game:
         if not self.game_map.walkable[dest_x, dest_y]:
             return None
 
-        self.player.x = dest_x
-        self.player.y = dest_y
+        self.move_entity(self.player, dest_x, dest_y)
         self.recompute_fov()
 
         # Notify if there are items here
@@ -489,23 +682,38 @@ class Game:
 
     def _get_blocking_entity_at(self, x: int, y: int) -> Entity | None:
         """Return blocking entity at given position, if any."""
-        for entity in self.entities:
-            if entity.blocks and entity.x == x and entity.y == y and entity != self.player:
-                return entity
-        return None
+        entity = self._blocker_pos.get((x, y))
+        if entity is self.player:
+            return None
+        return entity
 
     def _process_enemy_turns(self) -> None:
         """Process all enemy turns."""
-        for entity in self.entities:
-            if entity != self.player and hasattr(entity, 'take_turn'):
-                entity.take_turn(self)
+        actors = self._actors
+        if actors:
+            # Monsters out of view skip their turn. FOV is not recomputed while
+            # enemies act and each monster only moves itself, so every monster's
+            # visibility can be decided up front in one gather.
+            xs = np.fromiter((a.x for a in actors), dtype=np.int32, count=len(actors))
+            ys = np.fromiter((a.y for a in actors), dtype=np.int32, count=len(actors))
+            acting = np.flatnonzero(self.game_map.visible[xs, ys])
+            # Visible monsters beyond chase range idle too. A knockback can move
+            # the player mid-phase, so the precomputed range only holds while the
+            # player is still where the phase started.
+            player = self.player
+            px, py = player.x, player.y
+            in_range = np.maximum(np.abs(xs[acting] - px), np.abs(ys[acting] - py)) <= CHASE_RANGE
+            take_turns = self._take_turns
+            for i, near in zip(acting.tolist(), in_range.tolist()):
+                if near or player.x != px or player.y != py:
+                    take_turns[i](self)
 
         if self.player.hp <= 0:
             self.game_over = True
             self.add_message(f"YOU DIED! Kills: {self.kills}. Press R to restart.", (255, 0, 0))
 
     def render(self, console: tcod.console.Console) -> None:
-        """Render the game to the console."""
+        """Render the game to the console (an order="F" console, as created in main.py)."""
         # If inventory is open, render that instead
         if self.state == GameState.INVENTORY and self.inventory_screen:
             self.inventory_screen.render(console)
@@ -522,90 +730,127 @@ class Game:
 
         self.game_map.render(console, self.tileset_manager)
 
-        # Render blood effects
-        for effect in self.effects.effects:
-            if hasattr(effect, 'permanent') and effect.permanent:
-                if self.game_map.visible[effect.x, effect.y]:
-                    if self.game_map.walkable[effect.x, effect.y]:
-                        console.print(effect.x, effect.y, effect.char, fg=effect.color)
+        visible = self.game_map.visible
+        cells = console.rgb  # Indexed [x, y] for order="F" consoles
+
+        # Render blood effects (visible, walkable tiles only)
+        effects = self.effects
+        n = effects.blood_count
+        if n:
+            sel, xs, ys = _gather_visible(
+                visible & self.game_map.walkable, effects.blood_xs[:n], effects.blood_ys[:n]
+            )
+            cells["ch"][xs, ys] = BLOOD_CHAR_LUT[effects.blood_chars[sel]]
+            cells["fg"][xs, ys] = BLOOD_COLOR_LUT[effects.blood_colors[sel]]
 
         # Render ground items
-        for (x, y), items in self.ground_items.items():
-            if self.game_map.visible[x, y] and items:
-                # Show the top item
-                item = items[0]
-                console.print(x, y, item.char, fg=item.color)
+        # Show the top item of each visible pile
+        if len(self._ground_xy):
+            sel, xs, ys = _gather_visible(visible, self._ground_xy[:, 0], self._ground_xy[:, 1])
+            if sel.size:
+                shown = [self.ground_items[pos][0] for pos in zip(xs.tolist(), ys.tolist())]
+                cells["ch"][xs, ys] = [ord(item.char) for item in shown]
+                cells["fg"][xs, ys] = [item.color for item in shown]
 
         # Render entities
-        entities_sorted = sorted(self.entities, key=lambda e: e.render_order)
-        for entity in entities_sorted:
-            if self.game_map.visible[entity.x, entity.y]:
-                render_char = entity.get_render_char(self.tileset_manager)
-                render_color = entity.get_render_color()
-                console.print(entity.x, entity.y, render_char, fg=render_color)
+        entities = self._render_sorted
+        sel, xs, ys = _gather_visible(
+            visible,
+            np.fromiter((e.x for e in entities), dtype=np.int32, count=len(entities)),
+            np.fromiter((e.y for e in entities), dtype=np.int32, count=len(entities)),
+        )
+        if sel.size:
+            shown = [entities[i] for i in sel]
+            cells["ch"][xs, ys] = [ord(e.get_render_char(self.tileset_manager)) for e in shown]
+            cells["fg"][xs, ys] = [e.get_render_color() for e in shown]
 
         self._render_ui(console)
 
+    def _get_ui_cache(self) -> dict:
+        """Return derived UI values, refreshing any whose inputs changed."""
+        cache = self._ui_cache
+
+        hp_key = (self.player.hp, self.player.max_hp)
+        if cache.get("hp_key") != hp_key:
+            cache["hp_key"] = hp_key
+            cache["hp_text"] = f"HP: {self.player.hp}/{self.player.max_hp}"
+            cache["filled"] = int((self.player.hp / self.player.max_hp) * _HP_BAR[2])
+
+        if "recent_msgs" not in cache:
+            cache["recent_msgs"] = [
+                (text[:self.screen_width - 2], color) for text, color in itertools.islice(
+                    self.messages, max(0, len(self.messages) - 3), None
+                )
+            ]
+
+        return cache
+
+    def _build_ui_static(self) -> tcod.console.Console:
+        """Draw the fixed parts of the UI panel: the separator and empty bar tracks."""
+        panel = tcod.console.Console(self.screen_width, self.ui_height, order="F")
+        panel.draw_rect(0, 0, self.screen_width, 1, ord("-"), fg=(100, 100, 100))
+        for (x, y, width), ch, fg in (
+            (_HP_BAR, "#", (100, 50, 50)),
+            (_XP_BAR, "-", (30, 60, 80)),
+            (_HUNGER_BAR, "-", (80, 70, 40)),
+            (_THIRST_BAR, "-", (40, 70, 80)),
+        ):
+            panel.draw_rect(x, y, width, 1, ord(ch), fg=fg)
+        return panel
+
     def _render_ui(self, console: tcod.console.Console) -> None:
         """Render the UI panel at the bottom."""
         ui_y = self.map_height
+        ui_cache = self._get_ui_cache()
+        cells = console.rgb
+        player = self.player
 
-        console.draw_rect(0, ui_y, self.screen_width, 1, ord("-"), fg=(100, 100, 100))
+        self._ui_static.blit(console, dest_y=ui_y)
 
         # Player name and level
-        name_text = f"{self.player.name} Lv.{self.player.level}"
-        console.print(1, ui_y + 1, name_text, fg=(255, 255, 255))
+        name_text = f"{player.name} Lv.{player.level}"
+        console.print(1, ui_y + 1, name_text, fg=_NAME_FG)
 
         # HP bar
-        hp_text = f"HP: {self.player.hp}/{self.player.max_hp}"
-        console.print(1, ui_y + 2, hp_text, fg=(255, 100, 100))
+        console.print(1, ui_y + 2, ui_cache["hp_text"], fg=_HP_FG)
 
-        bar_width = 20
-        filled = int((self.player.hp / self.player.max_hp) * bar_width)
-        console.draw_rect(1, ui_y + 3, bar_width, 1, ord("#"), fg=(100, 50, 50))
-        if filled > 0:
-            console.draw_rect(1, ui_y + 3, filled, 1, ord("#"), fg=(255, 50, 50))
+        x, y, _ = _HP_BAR
+        _fill_bar(cells, x, ui_y + y, ui_cache["filled"], ord("#"), _HP_BAR_FG)
 
         # XP bar
-        xp_text = f"XP: {self.player.xp}/{self.player.xp_to_next_level}"
-        console.print(25, ui_y + 1, xp_text, fg=(100, 200, 255))
-        xp_filled = int((self.player.xp / self.player.xp_to_next_level) * 15)
-        console.draw_rect(25, ui_y + 2, 15, 1, ord("-"), fg=(30, 60, 80))
-        if xp_filled > 0:
-            console.draw_rect(25, ui_y + 2, xp_filled, 1, ord("="), fg=(100, 200, 255))
+        xp_text = f"XP: {player.xp}/{player.xp_to_next_level}"
+        console.print(25, ui_y + 1, xp_text, fg=_XP_FG)
+        x, y, width = _XP_BAR
+        xp_filled = int((player.xp / player.xp_to_next_level) * width)
+        _fill_bar(cells, x, ui_y + y, xp_filled, ord("="), _XP_FG)
 
         # Hunger/Thirst bars
-        hunger_text = f"HUN: {self.player.hunger}/100"
-        thirst_text = f"THR: {self.player.thirst}/100"
-        console.print(25, ui_y + 3, hunger_text, fg=(200, 180, 100))
-        console.print(50, ui_y + 3, thirst_text, fg=(100, 180, 200))
-        hunger_filled = int((self.player.hunger / 100) * 8)
-        thirst_filled = int((self.player.thirst / 100) * 8)
-        console.draw_rect(40, ui_y + 3, 8, 1, ord("-"), fg=(80, 70, 40))
-        console.draw_rect(65, ui_y + 3, 8, 1, ord("-"), fg=(40, 70, 80))
-        if hunger_filled > 0:
-            console.draw_rect(40, ui_y + 3, hunger_filled, 1, ord("="), fg=(200, 180, 100))
-        if thirst_filled > 0:
-            console.draw_rect(65, ui_y + 3, thirst_filled, 1, ord("="), fg=(100, 180, 200))
+        hunger_text = f"HUN: {player.hunger}/100"
+        thirst_text = f"THR: {player.thirst}/100"
+        console.print(25, ui_y + 3, hunger_text, fg=_HUNGER_FG)
+        console.print(50, ui_y + 3, thirst_text, fg=_THIRST_FG)
+        x, y, width = _HUNGER_BAR
+        _fill_bar(cells, x, ui_y + y, int((player.hunger / 100) * width), ord("="), _HUNGER_FG)
+        x, y, width = _THIRST_BAR
+        _fill_bar(cells, x, ui_y + y, int((player.thirst / 100) * width), ord("="), _THIRST_FG)
 
         # Stats - show total stats from equipment
-        console.print(45, ui_y + 1, f"ATK:{self.player.get_total_attack()}", fg=(255, 180, 100))
-        console.print(55, ui_y + 1, f"DEF:{self.player.get_total_defense()}", fg=(100, 180, 255))
-        console.print(45, ui_y + 2, f"CRIT:{self.player.get_total_crit_bonus() + 10}%", fg=(255, 255, 100))
-        console.print(55, ui_y + 2, f"Kills:{self.kills}", fg=(255, 100, 100))
+        console.print(45, ui_y + 1, f"ATK:{player.get_total_attack()}", fg=_ATK_FG)
+        console.print(55, ui_y + 1, f"DEF:{player.get_total_defense()}", fg=_DEF_FG)
+        console.print(45, ui_y + 2, f"CRIT:{player.get_total_crit_bonus() + 10}%", fg=_CRIT_FG)
+        console.print(55, ui_y + 2, f"Kills:{self.kills}", fg=_KILLS_FG)
 
         # Enemy count
-        zombie_count = len([e for e in self.entities if isinstance(e, Monster)])
-        console.print(68, ui_y + 1, f"Enemies:{zombie_count}", fg=(100, 200, 100))
+        console.print(68, ui_y + 1, f"Enemies:{len(self._actors)}", fg=_ENEMIES_FG)
 
         # Inventory count
-        inv_count = len(self.player.inventory)
-        console.print(68, ui_y + 2, f"Items:{inv_count}/{self.player.max_inventory_size}", fg=(200, 200, 100))
+        inv_count = len(player.inventory)
+        console.print(68, ui_y + 2, f"Items:{inv_count}/{player.max_inventory_size}", fg=_ITEMS_FG)
 
         # Messages (last 3)
         msg_y = ui_y + 4
-        for i, (text, color) in enumerate(self.messages[-3:]):
-            console.print(1, msg_y + i, text[:self.screen_width - 2], fg=color)
+        for i, (text, color) in enumerate(ui_cache["recent_msgs"]):
+            console.print(1, msg_y + i, text, fg=color)
 
         if self.game_over:
             console.print(
@@ -630,17 +875,15 @@ class Game:
         # Draw box background
         console.draw_rect(box_x, box_y, box_width, box_height, ord(" "), bg=(20, 20, 30))
 
-        # Draw border
-        for x in range(box_x, box_x + box_width):
-            console.print(x, box_y, "-", fg=(80, 80, 100))
-            console.print(x, box_y + box_height - 1, "-", fg=(80, 80, 100))
-        for y in range(box_y, box_y + box_height):
-            console.print(box_x, y, "|", fg=(80, 80, 100))
-            console.print(box_x + box_width - 1, y, "|", fg=(80, 80, 100))
-        console.print(box_x, box_y, "+", fg=(80, 80, 100))
-        console.print(box_x + box_width - 1, box_y, "+", fg=(80, 80, 100))
-        console.print(box_x, box_y + box_height - 1, "+", fg=(80, 80, 100))
-        console.print(box_x + box_width - 1, box_y + box_height - 1, "+", fg=(80, 80, 100))
+        # Draw border with slice stores (console.rgb is indexed [x, y])
+        cells = console.rgb
+        x2 = box_x + box_width - 1
+        y2 = box_y + box_height - 1
+        cells["ch"][box_x:x2 + 1, [box_y, y2]] = ord("-")
+        cells["ch"][[box_x, x2], box_y:y2 + 1] = ord("|")
+        cells["ch"][[box_x, box_x, x2, x2], [box_y, y2, box_y, y2]] = ord("+")
+        cells["fg"][box_x:x2 + 1, [box_y, y2]] = _BORDER_FG
+        cells["fg"][[box_x, x2], box_y:y2 + 1] = _BORDER_FG
 
         # Title
         title = " PAUSED "
@@ -6,6 +6,39 @@ from __future__ import annotations
 
 import tcod.event
 
+# Movement keys
+_MOVE_KEYS: dict[tcod.event.KeySym, tuple[int, int]] = {
+    # Arrow keys
+    tcod.event.KeySym.UP: (0, -1),
+    tcod.event.KeySym.DOWN: (0, 1),
+    tcod.event.KeySym.LEFT: (-1, 0),
+    tcod.event.KeySym.RIGHT: (1, 0),
+
+    # WASD
+    tcod.event.KeySym.w: (0, -1),
+    tcod.event.KeySym.s: (0, 1),
+    tcod.event.KeySym.a: (-1, 0),
+    tcod.event.KeySym.d: (1, 0),
+
+    # Numpad
+    tcod.event.KeySym.KP_8: (0, -1),
+    tcod.event.KeySym.KP_2: (0, 1),
+    tcod.event.KeySym.KP_4: (-1, 0),
+    tcod.event.KeySym.KP_6: (1, 0),
+    tcod.event.KeySym.KP_7: (-1, -1),
+    tcod.event.KeySym.KP_9: (1, -1),
+    tcod.event.KeySym.KP_1: (-1, 1),
+    tcod.event.KeySym.KP_3: (1, 1),
+
+    # Diagonal with QEZC
+    tcod.event.KeySym.q: (-1, -1),
+    tcod.event.KeySym.e: (1, -1),
+    tcod.event.KeySym.z: (-1, 1),
+    tcod.event.KeySym.c: (1, 1),
+}
+
+_WAIT_KEYS = frozenset({tcod.event.KeySym.PERIOD, tcod.event.KeySym.KP_5})
+
 
 def handle_keys(event: tcod.event.Event) -> str | tuple | None:
     """
@@ -26,43 +59,14 @@ def handle_keys(event: tcod.event.Event) -> str | tuple | None:
 
     key = event.sym
 
-    # Movement keys
-    move_keys = {
-        # Arrow keys
-        tcod.event.KeySym.UP: (0, -1),
-        tcod.event.KeySym.DOWN: (0, 1),
-        tcod.event.KeySym.LEFT: (-1, 0),
-        tcod.event.KeySym.RIGHT: (1, 0),
-
-        # WASD
-        tcod.event.KeySym.w: (0, -1),
-        tcod.event.KeySym.s: (0, 1),
-        tcod.event.KeySym.a: (-1, 0),
-        tcod.event.KeySym.d: (1, 0),
-
-        # Numpad
-        tcod.event.KeySym.KP_8: (0, -1),
-        tcod.event.KeySym.KP_2: (0, 1),
-        tcod.event.KeySym.KP_4: (-1, 0),
-        tcod.event.KeySym.KP_6: (1, 0),
-        tcod.event.KeySym.KP_7: (-1, -1),
-        tcod.event.KeySym.KP_9: (1, -1),
-        tcod.event.KeySym.KP_1: (-1, 1),
-        tcod.event.KeySym.KP_3: (1, 1),
-
-        # Diagonal with QEZC
-        tcod.event.KeySym.q: (-1, -1),
-        tcod.event.KeySym.e: (1, -1),
-        tcod.event.KeySym.z: (-1, 1),
-        tcod.event.KeySym.c: (1, 1),
-    }
-
-    if key in move_keys:
-        dx, dy = move_keys[key]
+    # Movement
+    move = _MOVE_KEYS.get(key)
+    if move is not None:
+        dx, dy = move
         return ("move", dx, dy)
 
     # Wait
-    if key in (tcod.event.KeySym.PERIOD, tcod.event.KeySym.KP_5):
+    if key in _WAIT_KEYS:
         return "wait"
 
     # Inventory
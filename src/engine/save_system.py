@@ -1,26 +1,51 @@
 """
 Save/Load system - Persist game state to disk
-Uses JSON for human-readable save files
+Uses JSON save files, encoded with orjson when it is installed
 """
 
 from __future__ import annotations
 
+import base64
 import json
 import os
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is the fallback
+    orjson = None
+
 if TYPE_CHECKING:
     from src.engine.game import Game
     from src.entities.player import Player, PlayerStats
-    from src.items.item import Item
 
 
 # Default save directory
 SAVE_DIR = Path.home() / ".deadhorizon" / "saves"
 
 
+def _write_json(path: Path, data: dict) -> None:
+    """Write data to path as compact JSON."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+def _read_json(path: Path) -> Any:
+    """Read JSON from path. Malformed files raise json.JSONDecodeError either way."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())  # orjson.JSONDecodeError subclasses it
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def get_save_path(slot: int = 0) -> Path:
     """Get the path for a save file."""
     SAVE_DIR.mkdir(parents=True, exist_ok=True)
@@ -39,15 +64,14 @@ def get_save_info(slot: int = 0) -> dict | None:
         return None
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return {
-                "player_name": data.get("player", {}).get("name", "Unknown"),
-                "level": data.get("player", {}).get("level", 1),
-                "kills": data.get("kills", 0),
-                "save_date": data.get("save_date", "Unknown"),
-                "dungeon_level": data.get("dungeon_level", 1),
-            }
+        data = _read_json(path)
+        return {
+            "player_name": data.get("player", {}).get("name", "Unknown"),
+            "level": data.get("player", {}).get("level", 1),
+            "kills": data.get("kills", 0),
+            "save_date": data.get("save_date", "Unknown"),
+            "dungeon_level": data.get("dungeon_level", 1),
+        }
     except (json.JSONDecodeError, KeyError):
         return None
 
@@ -65,62 +89,9 @@ def delete_save(slot: int = 0) -> bool:
 # SERIALIZATION - Convert game objects to JSON-compatible dicts
 # =============================================================================
 
-def serialize_item(item: "Item") -> dict:
-    """Convert an Item to a JSON-serializable dict."""
-    return {
-        "name": item.name,
-        "char": item.char,
-        "color": list(item.color),
-        "item_type": item.item_type.name,
-        "description": item.description,
-        "equip_slot": item.equip_slot.name,
-        "stats": {
-            "damage": item.stats.damage,
-            "defense": item.stats.defense,
-            "accuracy": item.stats.accuracy,
-            "crit_bonus": item.stats.crit_bonus,
-            "hp_restore": item.stats.hp_restore,
-            "hunger_restore": item.stats.hunger_restore,
-            "thirst_restore": item.stats.thirst_restore,
-        },
-        "stackable": item.stackable,
-        "stack_size": item.stack_size,
-        "max_stack": item.max_stack,
-        "value": item.value,
-        "weight": item.weight,
-    }
-
-
-def deserialize_item(data: dict) -> "Item":
-    """Create an Item from a JSON dict."""
-    from src.items.item import Item, ItemType, ItemStats, EquipSlot
-
-    return Item(
-        name=data["name"],
-        char=data["char"],
-        color=tuple(data["color"]),
-        item_type=ItemType[data["item_type"]],
-        description=data.get("description", ""),
-        equip_slot=EquipSlot[data["equip_slot"]],
-        stats=ItemStats(
-            damage=data["stats"].get("damage", 0),
-            defense=data["stats"].get("defense", 0),
-            accuracy=data["stats"].get("accuracy", 0),
-            crit_bonus=data["stats"].get("crit_bonus", 0),
-            hp_restore=data["stats"].get("hp_restore", 0),
-            hunger_restore=data["stats"].get("hunger_restore", 0),
-            thirst_restore=data["stats"].get("thirst_restore", 0),
-        ),
-        stackable=data.get("stackable", False),
-        stack_size=data.get("stack_size", 1),
-        max_stack=data.get("max_stack", 1),
-        value=data.get("value", 1),
-        weight=data.get("weight", 1.0),
-    )
-
-
 def serialize_player(player: "Player") -> dict:
     """Convert Player to JSON-serializable dict."""
+    stats = player.stats
     return {
         "x": player.x,
         "y": player.y,
@@ -133,15 +104,15 @@ def serialize_player(player: "Player") -> dict:
         "xp": player.xp,
         "xp_to_next_level": player.xp_to_next_level,
         "stats": {
-            "strength": player.stats.strength,
-            "agility": player.stats.agility,
-            "vitality": player.stats.vitality,
-            "endurance": player.stats.endurance,
-            "perception": player.stats.perception,
+            "strength": stats.strength,
+            "agility": stats.agility,
+            "vitality": stats.vitality,
+            "endurance": stats.endurance,
+            "perception": stats.perception,
         },
-        "inventory": [serialize_item(item) for item in player.inventory],
-        "equipped_weapon": serialize_item(player.equipped_weapon) if player.equipped_weapon else None,
-        "equipped_armor": serialize_item(player.equipped_armor) if player.equipped_armor else None,
+        "inventory": [item.to_dict() for item in player.inventory],
+        "equipped_weapon": player.equipped_weapon.to_dict() if player.equipped_weapon else None,
+        "equipped_armor": player.equipped_armor.to_dict() if player.equipped_armor else None,
     }
 
 
@@ -158,32 +129,35 @@ def serialize_monster(monster) -> dict:
 
 def serialize_ground_items(ground_items: dict) -> list:
     """Convert ground items dict to JSON-serializable list."""
-    result = []
-    for (x, y), items in ground_items.items():
-        for item in items:
-            result.append({
-                "x": x,
-                "y": y,
-                "item": serialize_item(item),
-            })
-    return result
+    return [
+        {"x": x, "y": y, "item": item.to_dict()}
+        for (x, y), items in ground_items.items()
+        for item in items
+    ]
+
+
+def pack_mask(mask: np.ndarray) -> str:
+    """Pack a 2D bool array into a base64 string, one bit per tile."""
+    return base64.b64encode(np.packbits(mask, axis=None).tobytes()).decode("ascii")
+
+
+def unpack_mask(payload: str, width: int, height: int) -> np.ndarray:
+    """Inverse of pack_mask: decode a base64 bit string into a (width, height) bool array."""
+    bits = np.unpackbits(np.frombuffer(base64.b64decode(payload), dtype=np.uint8), count=width * height)
+    return bits.reshape(width, height).astype(bool)
 
 
 def serialize_map(game_map) -> dict:
     """Convert GameMap to JSON-serializable dict."""
-    # Store walkable as a simple 2D list of bools
-    walkable = [[bool(game_map.tiles[x, y]["walkable"]) for y in range(game_map.height)]
-                for x in range(game_map.width)]
-    explored = game_map.explored.tolist()
-
+    # Masks are stored bit-packed; saves from before this change used nested lists
     return {
         "width": game_map.width,
         "height": game_map.height,
-        "walkable": walkable,
-        "explored": explored,
+        "walkable_bits": pack_mask(game_map.walkable),
+        "explored_bits": pack_mask(game_map.explored),
         "rooms": [
             {"x1": r.x1, "y1": r.y1, "x2": r.x2, "y2": r.y2}
-            for r in getattr(game_map, "rooms", [])
+            for r in game_map.rooms
         ],
     }
 
@@ -214,13 +188,11 @@ def save_game(game: "Game", slot: int = 0) -> bool:
             "map": serialize_map(game.game_map),
             "kills": game.kills,
             "turns": game.turns,
-            "messages": game.messages[-20:],  # Keep last 20 messages
+            "messages": list(game.messages)[-20:],  # Keep last 20 messages
             "dungeon_level": getattr(game, "dungeon_level", 1),
         }
 
-        path = get_save_path(slot)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(save_data, f, indent=2)
+        _write_json(get_save_path(slot), save_data)
 
         return True
     except Exception as e:
@@ -239,18 +211,18 @@ def load_game(game: "Game", slot: int = 0) -> bool:  # pylint: disable=too-many-
     """
     from src.entities.player import Player, PlayerStats
     from src.entities.monster import Monster, ZombieType
+    from src.items.item import Item
     from src.map.game_map import GameMap
     from src.map.procgen import RectangularRoom
     from src.map import tile as tile_types
-    import numpy as np
+    from src.engine.game import MAX_MESSAGES
 
     path = get_save_path(slot)
     if not path.exists():
         return False
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(path)
 
         # Restore player stats
         stats_data = data["player"]["stats"]
@@ -264,19 +236,23 @@ def load_game(game: "Game", slot: int = 0) -> bool:  # pylint: disable=too-many-
 
         # Restore map
         map_data = data["map"]
-        game.game_map = GameMap(map_data["width"], map_data["height"])
+        width, height = map_data["width"], map_data["height"]
+        game.game_map = GameMap(width, height)
+
+        if "walkable_bits" in map_data:
+            walkable = unpack_mask(map_data["walkable_bits"], width, height)
+            explored = unpack_mask(map_data["explored_bits"], width, height)
+        else:
+            # Older saves store the masks as nested lists
+            walkable = np.array(map_data["walkable"], dtype=bool)
+            explored = np.array(map_data["explored"], dtype=bool)
 
         # Rebuild tiles from walkable data
-        walkable = map_data["walkable"]
-        for x in range(map_data["width"]):
-            for y in range(map_data["height"]):
-                if walkable[x][y]:
-                    game.game_map.tiles[x, y] = tile_types.floor
-                else:
-                    game.game_map.tiles[x, y] = tile_types.wall
+        game.game_map.set_tile(walkable, tile_types.FLOOR)
+        game.game_map.set_tile(~walkable, tile_types.WALL)
 
         # Restore explored
-        game.game_map.explored = np.array(map_data["explored"], dtype=bool)
+        game.game_map.explored[:] = explored
 
         # Restore rooms
         game.game_map.rooms = [
@@ -303,15 +279,15 @@ def load_game(game: "Game", slot: int = 0) -> bool:  # pylint: disable=too-many-
 
         # Restore inventory
         game.player.inventory = [
-            deserialize_item(item_data)
+            Item.from_dict(item_data)
             for item_data in player_data.get("inventory", [])
         ]
 
         # Restore equipment
         if player_data.get("equipped_weapon"):
-            game.player.equipped_weapon = deserialize_item(player_data["equipped_weapon"])
+            game.player.equipped_weapon = Item.from_dict(player_data["equipped_weapon"])
         if player_data.get("equipped_armor"):
-            game.player.equipped_armor = deserialize_item(player_data["equipped_armor"])
+            game.player.equipped_armor = Item.from_dict(player_data["equipped_armor"])
 
         # Restore entities
         game.entities = [game.player]
@@ -327,20 +303,19 @@ def load_game(game: "Game", slot: int = 0) -> bool:  # pylint: disable=too-many-
             monster.hp = monster_data["hp"]
             monster.max_hp = monster_data["max_hp"]
             game.entities.append(monster)
+        game._rebuild_entity_index()
 
         # Restore ground items
-        game.ground_items = {}
+        game._clear_ground_items()
         for item_entry in data.get("ground_items", []):
-            x, y = item_entry["x"], item_entry["y"]
-            item = deserialize_item(item_entry["item"])
-            if (x, y) not in game.ground_items:
-                game.ground_items[(x, y)] = []
-            game.ground_items[(x, y)].append(item)
+            item = Item.from_dict(item_entry["item"])
+            game._add_ground_item(item_entry["x"], item_entry["y"], item)
 
         # Restore game state
         game.kills = data.get("kills", 0)
         game.turns = data.get("turns", 0)
-        game.messages = data.get("messages", [])
+        game.messages = deque(data.get("messages", []), maxlen=MAX_MESSAGES)
+        game._ui_cache.clear()
         game.dungeon_level = data.get("dungeon_level", 1)
 
         # Recompute FOV
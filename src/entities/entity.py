@@ -4,6 +4,7 @@ Base Entity class - All game objects inherit from this
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,11 +16,18 @@ class Entity:
     A generic object to represent players, enemies, items, etc.
     """
 
+    __slots__ = (
+        "x", "y", "char", "color", "base_color", "name", "blocks",
+        "render_order", "tile_id", "_tile_char", "is_flashing",
+    )
+
     # Render order constants
     RENDER_ORDER_CORPSE = 0
     RENDER_ORDER_ITEM = 1
     RENDER_ORDER_ACTOR = 2
 
+    FLASH_COLOR = (255, 60, 60)  # Bright red damage flash
+
     def __init__(
         self,
         x: int,
@@ -40,6 +48,7 @@ class Entity:
         self.blocks = blocks
         self.render_order = render_order
         self.tile_id = tile_id  # PUA codepoint for tile graphics
+        self._tile_char = chr(tile_id) if tile_id is not None else None
         self.is_flashing = False  # Damage flash state
 
     def move(self, dx: int, dy: int) -> None:
@@ -49,14 +58,18 @@ class Entity:
 
     def distance_to(self, other: Entity) -> float:
         """Return the distance to another entity."""
+        return math.hypot(other.x - self.x, other.y - self.y)
+
+    def distance_sq_to(self, other: Entity) -> int:
+        """Return the squared distance to another entity, for range checks without a sqrt."""
         dx = other.x - self.x
         dy = other.y - self.y
-        return (dx ** 2 + dy ** 2) ** 0.5
+        return dx * dx + dy * dy
 
     def get_render_color(self) -> tuple[int, int, int]:
         """Get the current render color (with flash effect applied)."""
         if self.is_flashing:
-            return (255, 60, 60)  # Bright red flash
+            return self.FLASH_COLOR
         return self.color
 
     def get_render_char(self, tileset_manager: TilesetManager | None = None) -> str:
@@ -66,8 +79,8 @@ class Entity:
         If tileset_manager is provided and in TILES mode, returns the tile character.
         Otherwise returns the ASCII character.
         """
-        if tileset_manager and tileset_manager.is_tiles_mode and self.tile_id is not None:
-            return chr(self.tile_id)
+        if self._tile_char is not None and tileset_manager and tileset_manager.is_tiles_mode:
+            return self._tile_char
         return self.char
 
     def __repr__(self) -> str:
@@ -4,10 +4,12 @@ Monster entity - Enemies that roam the map
 
 from __future__ import annotations
 
+import sys
 from enum import Enum, auto
 from typing import TYPE_CHECKING
 
 from src.entities.entity import Entity
+from src.systems.combat import Combat, AttackResult
 
 if TYPE_CHECKING:
     from src.engine.game import Game
@@ -32,10 +34,21 @@ ZOMBIE_CONFIGS = {
     ZombieType.SKELETON: ("Skeleton", "S", (220, 220, 200), 8, 3, 1, "skeleton"),
 }
 
+# The same configs as a tuple indexed by ZombieType.value - 1, with the strings interned
+_ZOMBIE_ROWS = tuple(
+    (sys.intern(name), sys.intern(char), color, hp, attack, defense, sys.intern(tile_name))
+    for name, char, color, hp, attack, defense, tile_name in (ZOMBIE_CONFIGS[t] for t in ZombieType)
+)
+
+# Chebyshev distance within which a visible monster chases the player
+CHASE_RANGE = 8
+
 
 class Monster(Entity):
     """A hostile creature."""
 
+    __slots__ = ("hp", "max_hp", "attack", "defense", "zombie_type")
+
     def __init__(
         self,
         x: int,
@@ -81,7 +94,7 @@ class Monster(Entity):
         tileset_manager: TilesetManager | None = None,
     ) -> "Monster":
         """Factory method to spawn a zombie of the given type."""
-        name, char, color, hp, attack, defense, tile_name = ZOMBIE_CONFIGS[zombie_type]
+        name, char, color, hp, attack, defense, tile_name = _ZOMBIE_ROWS[zombie_type.value - 1]
         return cls(
             x=x,
             y=y,
@@ -105,12 +118,15 @@ class Monster(Entity):
         # Get direction towards player
         dx = game.player.x - self.x
         dy = game.player.y - self.y
-        distance = max(abs(dx), abs(dy))
+        # Chebyshev distance, inlined rather than max(abs(dx), abs(dy))
+        adx = dx if dx >= 0 else -dx
+        ady = dy if dy >= 0 else -dy
+        distance = adx if adx > ady else ady
 
         if distance <= 1:
             # Adjacent to player - attack!
             self._attack_player(game)
-        elif distance <= 8:
+        elif distance <= CHASE_RANGE:
             # Chase player
             self._move_towards_player(game, dx, dy)
 
@@ -122,8 +138,6 @@ class Monster(Entity):
 
     def _attack_player(self, game: Game) -> None:
         """Attack the player using enhanced combat system."""
-        from src.systems.combat import Combat, AttackResult
-
         result, damage = Combat.perform_attack(self, game.player, game)
 
         # Get and display combat message
@@ -134,8 +148,7 @@ class Monster(Entity):
 
         # Visual effects
         if result != AttackResult.MISS:
-            game.player.is_flashing = True
-            game.effects.add_damage_flash(game.player.x, game.player.y)
+            game.flash_entity(game.player)
 
             if damage > 0:
                 blood_amount = 1
@@ -148,25 +161,24 @@ class Monster(Entity):
     def _move_towards_player(self, game: Game, dx: int, dy: int) -> None:
         """Move one step towards the player."""
         # Normalize to -1, 0, or 1
-        step_x = 0 if dx == 0 else (1 if dx > 0 else -1)
-        step_y = 0 if dy == 0 else (1 if dy > 0 else -1)
-
-        dest_x = self.x + step_x
-        dest_y = self.y + step_y
-
-        # Check if destination is walkable and not blocked by entity
-        if game.game_map.walkable[dest_x, dest_y]:
-            blocking = game._get_blocking_entity_at(dest_x, dest_y)
-            if blocking is None:
-                self.x = dest_x
-                self.y = dest_y
-            elif step_x != 0 and step_y != 0:
-                # Try horizontal only
-                if game.game_map.walkable[self.x + step_x, self.y]:
-                    if game._get_blocking_entity_at(self.x + step_x, self.y) is None:
-                        self.x += step_x
-                        return
-                # Try vertical only
-                if game.game_map.walkable[self.x, self.y + step_y]:
-                    if game._get_blocking_entity_at(self.x, self.y + step_y) is None:
-                        self.y += step_y
+        step_x = (dx > 0) - (dx < 0)
+        step_y = (dy > 0) - (dy < 0)
+
+        walkable = game.game_map.walkable
+        x, y = self.x, self.y
+
+        # Walls stop the move outright; only a diagonal blocked by an entity
+        # falls back to horizontal only, then vertical only
+        if not walkable[x + step_x, y + step_y]:
+            return
+        if step_x and step_y:
+            candidates = ((step_x, step_y), (step_x, 0), (0, step_y))
+        else:
+            candidates = ((step_x, step_y),)
+
+        for cx, cy in candidates:
+            dest_x = x + cx
+            dest_y = y + cy
+            if walkable[dest_x, dest_y] and game._get_blocking_entity_at(dest_x, dest_y) is None:
+                game.move_entity(self, dest_x, dest_y)
+                return
@@ -9,10 +9,11 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from src.entities.entity import Entity
+from src.items.item import EquipSlot, ItemType
 
 if TYPE_CHECKING:
     from src.graphics.tileset_manager import TilesetManager
-    from src.items.item import Item, EquipSlot
+    from src.items.item import Item
 
 
 @dataclass
@@ -60,6 +61,12 @@ class PlayerStats:
 class Player(Entity):
     """The player character."""
 
+    __slots__ = (
+        "stats", "max_hp", "hp", "attack", "defense", "crit_bonus", "accuracy_bonus", "fov_radius",
+        "hunger", "thirst", "level", "xp", "xp_to_next_level",
+        "inventory", "max_inventory_size", "equipped_weapon", "equipped_armor",
+    )
+
     def __init__(
         self,
         x: int,
@@ -96,6 +103,9 @@ class Player(Entity):
         # Crit bonus for combat system
         self.crit_bonus = self.stats.get_crit_chance() - 5  # Subtract base 5%
 
+        # Accuracy bonus for combat system
+        self.accuracy_bonus = self.stats.get_accuracy_bonus()
+
         # FOV radius
         self.fov_radius = self.stats.get_fov_radius()
 
@@ -153,6 +163,7 @@ class Player(Entity):
         self.attack = self.stats.get_attack()
         self.defense = self.stats.get_defense()
         self.crit_bonus = self.stats.get_crit_chance() - 5
+        self.accuracy_bonus = self.stats.get_accuracy_bonus()
         self.fov_radius = self.stats.get_fov_radius()
 
         # Adjust current HP proportionally
@@ -185,10 +196,11 @@ class Player(Entity):
 
     def remove_from_inventory(self, item: "Item") -> bool:
         """Remove an item from inventory."""
-        if item in self.inventory:
+        try:
             self.inventory.remove(item)
-            return True
-        return False
+        except ValueError:
+            return False
+        return True
 
     def get_inventory_weight(self) -> float:
         """Get total weight of inventory."""
@@ -203,14 +215,11 @@ class Player(Entity):
         Equip an item from inventory.
         Returns (success, message).
         """
-        from src.items.item import EquipSlot
-
         if item.equip_slot == EquipSlot.NONE:
             return False, f"{item.name} cannot be equipped."
 
         # Remove from inventory first
-        if item in self.inventory:
-            self.inventory.remove(item)
+        self.remove_from_inventory(item)
 
         old_item = None
 
@@ -232,8 +241,6 @@ class Player(Entity):
         Unequip an item and return it to inventory.
         Returns (success, message).
         """
-        from src.items.item import EquipSlot
-
         item = None
 
         if slot == EquipSlot.WEAPON:
@@ -272,7 +279,7 @@ class Player(Entity):
 
     def get_total_accuracy(self) -> int:
         """Get total accuracy bonus from equipment."""
-        total = self.stats.get_accuracy_bonus()
+        total = self.accuracy_bonus
         if self.equipped_weapon:
             total += self.equipped_weapon.stats.accuracy
         if self.equipped_armor:
@@ -297,8 +304,6 @@ class Player(Entity):
         Use a consumable item.
         Returns (success, message).
         """
-        from src.items.item import ItemType
-
         if item.item_type != ItemType.CONSUMABLE:
             return False, f"Cannot use {item.name}."
 
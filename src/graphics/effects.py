@@ -5,7 +5,8 @@ Visual effects system - damage flash, blood splatter, etc.
 from __future__ import annotations
 
 from enum import Enum, auto
-import random
+
+import numpy as np
 
 
 class EffectType(Enum):
@@ -15,6 +16,8 @@ class EffectType(Enum):
 
 class VisualEffect:
     """A temporary visual effect."""
+
+    __slots__ = ("x", "y", "effect_type", "duration", "color", "char", "permanent")
     
     def __init__(
         self,
@@ -46,25 +49,32 @@ class VisualEffect:
 
 class BloodSplatter(VisualEffect):
     """Blood on the ground - permanent until cleaned."""
+
+    __slots__ = ()
     
-    BLOOD_CHARS = [".", ",", "'", "`", "~", "*"]
-    BLOOD_COLORS = [
+    BLOOD_CHARS = (".", ",", "'", "`", "~", "*")
+    BLOOD_COLORS = (
         (139, 0, 0),    # Dark red
         (178, 34, 34),  # Firebrick
         (165, 42, 42),  # Brown red
         (128, 0, 0),    # Maroon
         (120, 20, 20),  # Darker
-    ]
+    )
     
-    def __init__(self, x: int, y: int) -> None:
-        char = random.choice(self.BLOOD_CHARS)
-        color = random.choice(self.BLOOD_COLORS)
+    def __init__(self, x: int, y: int, char: str, color: tuple[int, int, int]) -> None:
         super().__init__(x, y, EffectType.BLOOD_SPLATTER, duration=0, color=color, char=char)
         self.permanent = True
 
 
+# Lookup tables for stored blood: rows hold indices into these, not raw values
+BLOOD_CHAR_LUT = np.array([ord(c) for c in BloodSplatter.BLOOD_CHARS], dtype=np.int32)
+BLOOD_COLOR_LUT = np.array(BloodSplatter.BLOOD_COLORS, dtype=np.uint8)
+
+
 class DamageFlash(VisualEffect):
     """Brief red flash when entity takes damage."""
+
+    __slots__ = ()
     
     def __init__(self, x: int, y: int) -> None:
         super().__init__(
@@ -79,46 +89,94 @@ class DamageFlash(VisualEffect):
 class EffectsManager:
     """Manages all visual effects in the game."""
     
-    def __init__(self) -> None:
+    def __init__(self, rng: np.random.Generator | None = None) -> None:
+        # Rolls every splatter's spread, count and look; Game passes its seeded generator
+        self._rng = rng if rng is not None else np.random.default_rng()
         self.effects: list[VisualEffect] = []
         self.flash_positions: set[tuple[int, int]] = set()  # Positions flashing this frame
+
+        # Blood is permanent, so it is stored column-wise outside the tick loop.
+        # Buffers grow by doubling; only the first blood_count rows are live.
+        self.blood_count = 0
+        self.blood_xs = np.empty(64, dtype=np.int32)
+        self.blood_ys = np.empty(64, dtype=np.int32)
+        self.blood_chars = np.empty(64, dtype=np.uint8)  # Index into BLOOD_CHAR_LUT
+        self.blood_colors = np.empty(64, dtype=np.uint8)  # Index into BLOOD_COLOR_LUT
+        self._blood_by_pos: dict[tuple[int, int], int] = {}  # One row per tile
     
     def add_damage_flash(self, x: int, y: int) -> None:
         """Add a damage flash at position."""
         self.flash_positions.add((x, y))
         self.effects.append(DamageFlash(x, y))
     
+    def _append_blood(self, xs: np.ndarray, ys: np.ndarray) -> None:
+        """
+        Store splatters at the given positions with random looks, growing the buffers if full.
+        A tile keeps a single row: fresh blood on a bloodied tile replaces its look.
+        """
+        count = len(xs)
+        if self.blood_count + count > len(self.blood_xs):
+            size = len(self.blood_xs) * 2
+            while size < self.blood_count + count:
+                size *= 2
+            self.blood_xs = np.resize(self.blood_xs, size)
+            self.blood_ys = np.resize(self.blood_ys, size)
+            self.blood_chars = np.resize(self.blood_chars, size)
+            self.blood_colors = np.resize(self.blood_colors, size)
+        chars = self._rng.integers(len(BLOOD_CHAR_LUT), size=count).tolist()
+        colors = self._rng.integers(len(BLOOD_COLOR_LUT), size=count).tolist()
+        by_pos = self._blood_by_pos
+        for pos, char, color in zip(zip(xs.tolist(), ys.tolist()), chars, colors):
+            i = by_pos.get(pos)
+            if i is None:
+                i = by_pos[pos] = self.blood_count
+                self.blood_xs[i], self.blood_ys[i] = pos
+                self.blood_count = i + 1
+            self.blood_chars[i] = char
+            self.blood_colors[i] = color
+
     def add_blood(self, x: int, y: int, amount: int = 1) -> None:
         """Add blood splatter at and around position."""
-        # Blood at impact point
-        self.effects.append(BloodSplatter(x, y))
-        
-        # Splatter around (random nearby tiles)
-        for _ in range(amount - 1):
-            dx = random.randint(-1, 1)
-            dy = random.randint(-1, 1)
-            self.effects.append(BloodSplatter(x + dx, y + dy))
+        # Blood at impact point, then splatter around (random nearby tiles)
+        xs = np.full(amount, x, dtype=np.int32)
+        ys = np.full(amount, y, dtype=np.int32)
+        if amount > 1:
+            offsets = self._rng.integers(-1, 2, size=(2, amount - 1))  # Upper bound is exclusive
+            xs[1:] += offsets[0]
+            ys[1:] += offsets[1]
+        self._append_blood(xs, ys)
     
     def add_death_blood(self, x: int, y: int) -> None:
         """Add extra blood when something dies."""
-        self.add_blood(x, y, amount=random.randint(3, 5))
+        self.add_blood(x, y, amount=int(self._rng.integers(3, 6)))  # 3-5 drops
     
     def tick(self) -> None:
         """Advance all effects and remove expired ones."""
         self.flash_positions.clear()
-        self.effects = [e for e in self.effects if not e.tick()]
+        # Blood lives in the column arrays, so only short-lived flashes are here
+        if self.effects:
+            self.effects = [e for e in self.effects if not e.tick()]
     
     def is_flashing(self, x: int, y: int) -> bool:
         """Check if position has active damage flash."""
         return (x, y) in self.flash_positions
     
+    def _blood_effect(self, i: int) -> BloodSplatter:
+        """Build a standalone effect object for stored splatter i."""
+        return BloodSplatter(
+            int(self.blood_xs[i]),
+            int(self.blood_ys[i]),
+            char=BloodSplatter.BLOOD_CHARS[self.blood_chars[i]],
+            color=BloodSplatter.BLOOD_COLORS[self.blood_colors[i]],
+        )
+
     def get_blood_at(self, x: int, y: int) -> BloodSplatter | None:
         """Get blood splatter at position (for rendering under entities)."""
-        for effect in self.effects:
-            if effect.effect_type == EffectType.BLOOD_SPLATTER and effect.x == x and effect.y == y:
-                return effect
-        return None
+        i = self._blood_by_pos.get((x, y))
+        return self._blood_effect(i) if i is not None else None
     
     def get_effects_at(self, x: int, y: int) -> list[VisualEffect]:
         """Get all effects at a position."""
-        return [e for e in self.effects if e.x == x and e.y == y]
+        effects = [e for e in self.effects if e.x == x and e.y == y]
+        i = self._blood_by_pos.get((x, y))
+        return effects if i is None else [self._blood_effect(i)] + effects
@@ -4,6 +4,8 @@ TilesetManager - Handles loading and managing tilesets
 
 from __future__ import annotations
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -11,10 +13,66 @@ from typing import TYPE_CHECKING
 import numpy as np
 import tcod.tileset
 
+try:
+    import PIL.Image
+except ImportError:  # Without Pillow, load_tileset falls back to ASCII mode
+    PIL = None
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
 
+@functools.lru_cache(maxsize=32)
+def _read_sheet(path: str) -> NDArray[np.uint8]:
+    """Decode a PNG spritesheet to a read-only RGBA array, once per path."""
+    if PIL is None:
+        raise ImportError("Pillow is required to load DawnLike spritesheets")
+
+    with PIL.Image.open(path) as img:
+        # Convert to RGBA if needed (handles palette mode 'P')
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        # asarray wraps PIL's exported buffer instead of copying it again
+        sheet = np.asarray(img)
+    sheet.flags.writeable = False  # Shared by every caller; tiles are copied out
+    return sheet
+
+
+# Every custom tile: (category, name, sheets to try in order of preference, tile_x, tile_y).
+# Codepoints are fixed by table order, so the loader just walks this list.
+_TILE_LAYOUT = (
+    # Floor.png is 336x624 - 21 tiles wide, 39 tiles tall
+    ("terrain", "floor", ("Objects/Floor.png",), 1, 1),
+    ("terrain", "floor_alt", ("Objects/Floor.png",), 2, 1),
+    # Wall.png is 320x816 - 20 tiles wide
+    ("terrain", "wall", ("Objects/Wall.png",), 0, 1),
+    ("terrain", "wall_alt", ("Objects/Wall.png",), 1, 1),
+    # Door0.png is 128x80 - 8 tiles wide, 5 tiles tall
+    ("terrain", "door_closed", ("Objects/Door0.png",), 0, 0),
+    ("terrain", "door_open", ("Objects/Door0.png",), 3, 0),
+    ("player", "player", ("Characters/Player0.png",), 0, 0),
+    ("player", "player_alt", ("Characters/Player0.png",), 1, 0),
+    # Undead0.png has zombie/skeleton sprites
+    ("monster", "zombie", ("Characters/Undead0.png",), 0, 0),
+    ("monster", "zombie_fast", ("Characters/Undead0.png",), 1, 0),
+    ("monster", "zombie_brute", ("Characters/Undead0.png",), 2, 0),
+    ("monster", "skeleton", ("Characters/Undead0.png",), 4, 0),
+    ("monster", "crawler", ("Characters/Undead0.png",), 3, 0),
+    ("item", "weapon", ("Items/MedWep.png", "Items/ShortWep.png", "Items/LongWep.png"), 0, 0),
+    ("item", "food", ("Items/Food.png",), 0, 0),
+)
+
+
+def _number_tiles(starts: dict[str, int]) -> tuple[tuple[str, str, tuple[str, ...], int, int, int], ...]:
+    """Append a codepoint to each _TILE_LAYOUT row, counting up from its category's start."""
+    next_codepoint = dict(starts)
+    rows = []
+    for row in _TILE_LAYOUT:
+        rows.append(row + (next_codepoint[row[0]],))
+        next_codepoint[row[0]] += 1
+    return tuple(rows)
+
+
 class GraphicsMode(Enum):
     """Graphics rendering mode."""
     ASCII = auto()
@@ -37,6 +95,14 @@ class TilesetManager:
 
     TILE_SIZE = 16  # DawnLike uses 16x16 tiles
 
+    # _TILE_LAYOUT with codepoints attached, numbered once at import
+    _TILES = _number_tiles({
+        "terrain": PUA_TERRAIN_START,
+        "player": PUA_PLAYER_START,
+        "monster": PUA_MONSTER_START,
+        "item": PUA_ITEM_START,
+    })
+
     def __init__(self, assets_path: str | Path = "assets/tilesets/dawnlike") -> None:
         self.assets_path = Path(assets_path)
         self.tileset: tcod.tileset.Tileset | None = None
@@ -47,12 +113,12 @@ class TilesetManager:
         self._player_codepoints: dict[str, int] = {}
         self._monster_codepoints: dict[str, int] = {}
         self._item_codepoints: dict[str, int] = {}
-
-        # Counters for next available codepoint
-        self._next_terrain = self.PUA_TERRAIN_START
-        self._next_player = self.PUA_PLAYER_START
-        self._next_monster = self.PUA_MONSTER_START
-        self._next_item = self.PUA_ITEM_START
+        self._codepoints = {
+            "terrain": self._terrain_codepoints,
+            "player": self._player_codepoints,
+            "monster": self._monster_codepoints,
+            "item": self._item_codepoints,
+        }
 
     def load_tileset(self) -> tcod.tileset.Tileset:
         """
@@ -69,9 +135,8 @@ class TilesetManager:
         # Check if DawnLike assets exist
         if self.assets_path.exists():
             try:
-                self._load_terrain_tiles()
-                self._load_character_tiles()
-                self._load_item_tiles()
+                self._prefetch_sheets()
+                self._load_tiles()
                 self.mode = GraphicsMode.TILES
                 print(f"Loaded DawnLike tileset from {self.assets_path}")
             except Exception as e:
@@ -105,86 +170,41 @@ class TilesetManager:
         except Exception as e:
             print(f"Warning: Could not load base font: {e}")
 
-    def _load_terrain_tiles(self) -> None:
-        """Load terrain tiles (floor, wall, etc.)."""
-        objects_path = self.assets_path / "Objects"
-
-        # Load floor tiles
-        floor_path = objects_path / "Floor.png"
-        if floor_path.exists():
-            sheet = self._load_sheet(floor_path)
-            # Floor.png is 336x624 - 21 tiles wide, 39 tiles tall
-            # First row has various floor types
-            self._assign_terrain_tile("floor", sheet, 1, 1)
-            self._assign_terrain_tile("floor_alt", sheet, 2, 1)
-
-        # Load wall tiles
-        wall_path = objects_path / "Wall.png"
-        if wall_path.exists():
-            sheet = self._load_sheet(wall_path)
-            # Wall.png is 320x816 - 20 tiles wide
-            # Use a solid wall tile
-            self._assign_terrain_tile("wall", sheet, 0, 1)
-            self._assign_terrain_tile("wall_alt", sheet, 1, 1)
-
-        # Load door tiles
-        door_path = objects_path / "Door0.png"
-        if door_path.exists():
-            sheet = self._load_sheet(door_path)
-            # Door0.png is 128x80 - 8 tiles wide, 5 tiles tall
-            self._assign_terrain_tile("door_closed", sheet, 0, 0)
-            self._assign_terrain_tile("door_open", sheet, 3, 0)
-
-    def _load_character_tiles(self) -> None:
-        """Load character sprites (player, monsters)."""
-        chars_path = self.assets_path / "Characters"
-
-        # Load player sprite
-        player_path = chars_path / "Player0.png"
-        if player_path.exists():
-            sheet = self._load_sheet(player_path)
-            # Player0.png has various player sprites
-            self._assign_player_tile("player", sheet, 0, 0)
-            self._assign_player_tile("player_alt", sheet, 1, 0)
-
-        # Load undead/zombie sprites
-        undead_path = chars_path / "Undead0.png"
-        if undead_path.exists():
-            sheet = self._load_sheet(undead_path)
-            # Undead0.png has zombie/skeleton sprites
-            self._assign_monster_tile("zombie", sheet, 0, 0)
-            self._assign_monster_tile("zombie_fast", sheet, 1, 0)
-            self._assign_monster_tile("zombie_brute", sheet, 2, 0)
-            self._assign_monster_tile("skeleton", sheet, 4, 0)
-            self._assign_monster_tile("crawler", sheet, 3, 0)
-
-    def _load_item_tiles(self) -> None:
-        """Load item sprites (weapons, food, etc.)."""
-        items_path = self.assets_path / "Items"
-
-        # Load weapon sprites - try different weapon files
-        for weapon_file in ["MedWep.png", "ShortWep.png", "LongWep.png"]:
-            weapon_path = items_path / weapon_file
-            if weapon_path.exists():
-                sheet = self._load_sheet(weapon_path)
-                self._assign_item_tile("weapon", sheet, 0, 0)
-                break
-
-        # Load food sprites
-        food_path = items_path / "Food.png"
-        if food_path.exists():
-            sheet = self._load_sheet(food_path)
-            self._assign_item_tile("food", sheet, 0, 0)
+    def _find_sheet(self, names: tuple[str, ...]) -> Path | None:
+        """First of the candidate sheets that exists under the assets path."""
+        for name in names:
+            path = self.assets_path / name
+            if path.exists():
+                return path
+        return None
+
+    def _sheet_paths(self) -> list[Path]:
+        """Every existing spritesheet _load_tiles will read."""
+        paths = {self._find_sheet(sheets) for _, _, sheets, _, _, _ in self._TILES}
+        paths.discard(None)
+        return sorted(paths)
+
+    def _prefetch_sheets(self) -> None:
+        """Decode all spritesheets on a thread pool so the loaders hit the sheet cache."""
+        # PIL releases the GIL while decoding, so the PNGs decode in parallel
+        paths = self._sheet_paths()
+        if paths:
+            with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+                list(pool.map(self._load_sheet, paths))
+
+    def _load_tiles(self) -> None:
+        """Copy every _TILE_LAYOUT sprite into the tileset at its fixed codepoint."""
+        for category, name, sheets, tile_x, tile_y, codepoint in self._TILES:
+            path = self._find_sheet(sheets)
+            if path is None:
+                continue
+            tile = self._extract_tile(self._load_sheet(path), tile_x, tile_y)
+            self.tileset.set_tile(codepoint, tile)
+            self._codepoints[category][name] = codepoint
 
     def _load_sheet(self, path: Path) -> NDArray[np.uint8]:
-        """Load a PNG spritesheet as a numpy array."""
-        import PIL.Image
-
-        with PIL.Image.open(path) as img:
-            # Convert to RGBA if needed (handles palette mode 'P')
-            if img.mode != "RGBA":
-                img = img.convert("RGBA")
-            return np.array(img)
+        """Load a PNG spritesheet as a numpy array (cached per resolved path)."""
+        return _read_sheet(str(Path(path).resolve()))
 
     def _extract_tile(self, sheet: NDArray[np.uint8], tile_x: int, tile_y: int) -> NDArray[np.uint8]:
         """Extract a single 16x16 tile from a spritesheet."""
@@ -202,50 +222,6 @@ class TilesetManager:
 
         return sheet[y:y + self.TILE_SIZE, x:x + self.TILE_SIZE].copy()
 
-    def _assign_terrain_tile(self, name: str, sheet: NDArray[np.uint8], tile_x: int, tile_y: int) -> int:
-        """Assign a terrain tile to a PUA codepoint."""
-        codepoint = self._next_terrain
-        self._next_terrain += 1
-
-        tile = self._extract_tile(sheet, tile_x, tile_y)
-        self.tileset.set_tile(codepoint, tile)
-        self._terrain_codepoints[name] = codepoint
-
-        return codepoint
-
-    def _assign_player_tile(self, name: str, sheet: NDArray[np.uint8], tile_x: int, tile_y: int) -> int:
-        """Assign a player tile to a PUA codepoint."""
-        codepoint = self._next_player
-        self._next_player += 1
-
-        tile = self._extract_tile(sheet, tile_x, tile_y)
-        self.tileset.set_tile(codepoint, tile)
-        self._player_codepoints[name] = codepoint
-
-        return codepoint
-
-    def _assign_monster_tile(self, name: str, sheet: NDArray[np.uint8], tile_x: int, tile_y: int) -> int:
-        """Assign a monster tile to a PUA codepoint."""
-        codepoint = self._next_monster
-        self._next_monster += 1
-
-        tile = self._extract_tile(sheet, tile_x, tile_y)
-        self.tileset.set_tile(codepoint, tile)
-        self._monster_codepoints[name] = codepoint
-
-        return codepoint
-
-    def _assign_item_tile(self, name: str, sheet: NDArray[np.uint8], tile_x: int, tile_y: int) -> int:
-        """Assign an item tile to a PUA codepoint."""
-        codepoint = self._next_item
-        self._next_item += 1
-
-        tile = self._extract_tile(sheet, tile_x, tile_y)
-        self.tileset.set_tile(codepoint, tile)
-        self._item_codepoints[name] = codepoint
-
-        return codepoint
-
     # Public API for getting tile codepoints
 
     def get_terrain_tile(self, name: str) -> int | None:
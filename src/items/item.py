@@ -4,9 +4,16 @@ Item system - All items in the game
 
 from __future__ import annotations
 
+import copy
+import itertools
+import random
+import sys
 from enum import Enum, auto
 from dataclasses import dataclass, field
 
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ItemType(Enum):
     """Categories of items."""
@@ -25,9 +32,9 @@ class EquipSlot(Enum):
     NONE = auto()
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ItemStats:
-    """Combat stats provided by an item."""
+    """Combat stats provided by an item. Immutable, so copies of an item share one."""
     damage: int = 0          # Bonus damage (weapons)
     defense: int = 0         # Bonus defense (armor)
     accuracy: int = 0        # Bonus accuracy %
@@ -37,7 +44,7 @@ class ItemStats:
     thirst_restore: int = 0  # Thirst restored (drinks)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Item:
     """
     A game item that can be picked up, used, or equipped.
@@ -100,32 +107,64 @@ class Item:
             and self.stack_size + other.stack_size <= self.max_stack
         )
 
-    def copy(self) -> "Item":
-        """Create a copy of this item."""
-        return Item(
-            name=self.name,
-            char=self.char,
-            color=self.color,
-            item_type=self.item_type,
-            description=self.description,
-            equip_slot=self.equip_slot,
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict (the save-file item format)."""
+        stats = self.stats
+        return {
+            "name": self.name,
+            "char": self.char,
+            "color": list(self.color),
+            "item_type": self.item_type.name,
+            "description": self.description,
+            "equip_slot": self.equip_slot.name,
+            "stats": {
+                "damage": stats.damage,
+                "defense": stats.defense,
+                "accuracy": stats.accuracy,
+                "crit_bonus": stats.crit_bonus,
+                "hp_restore": stats.hp_restore,
+                "hunger_restore": stats.hunger_restore,
+                "thirst_restore": stats.thirst_restore,
+            },
+            "stackable": self.stackable,
+            "stack_size": self.stack_size,
+            "max_stack": self.max_stack,
+            "value": self.value,
+            "weight": self.weight,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Item":
+        """Create an Item from the dict written by to_dict."""
+        stats = data["stats"]
+        return cls(
+            name=data["name"],
+            char=data["char"],
+            color=tuple(data["color"]),
+            item_type=ItemType[data["item_type"]],
+            description=data.get("description", ""),
+            equip_slot=EquipSlot[data["equip_slot"]],
             stats=ItemStats(
-                damage=self.stats.damage,
-                defense=self.stats.defense,
-                accuracy=self.stats.accuracy,
-                crit_bonus=self.stats.crit_bonus,
-                hp_restore=self.stats.hp_restore,
-                hunger_restore=self.stats.hunger_restore,
-                thirst_restore=self.stats.thirst_restore,
+                damage=stats.get("damage", 0),
+                defense=stats.get("defense", 0),
+                accuracy=stats.get("accuracy", 0),
+                crit_bonus=stats.get("crit_bonus", 0),
+                hp_restore=stats.get("hp_restore", 0),
+                hunger_restore=stats.get("hunger_restore", 0),
+                thirst_restore=stats.get("thirst_restore", 0),
             ),
-            stackable=self.stackable,
-            stack_size=self.stack_size,
-            max_stack=self.max_stack,
-            value=self.value,
-            weight=self.weight,
-            tile_id=self.tile_id,
+            stackable=data.get("stackable", False),
+            stack_size=data.get("stack_size", 1),
+            max_stack=data.get("max_stack", 1),
+            value=data.get("value", 1),
+            weight=data.get("weight", 1.0),
         )
 
+    def copy(self) -> "Item":
+        """Create a copy of this item."""
+        # Every field is immutable (stats included), so a shallow copy is independent
+        return copy.copy(self)
+
 
 # ============================================================================
 # ITEM DEFINITIONS - All items in the game
@@ -352,35 +391,39 @@ def create_item(item_id: str) -> Item:
     return ITEMS[item_id].copy()
 
 
+# Item prototypes by category for random loot, in ITEMS order. Rolls pick a
+# prototype by tuple position and copy it, skipping the string-keyed lookup.
+_WEAPONS = tuple(v for k, v in ITEMS.items() if v.item_type == ItemType.WEAPON and k != "fists")
+_ARMORS = tuple(v for v in ITEMS.values() if v.item_type == ItemType.ARMOR)
+_CONSUMABLES = tuple(v for v in ITEMS.values() if v.item_type == ItemType.CONSUMABLE)
+
+# Every loot prototype with cumulative weights: consumables 60%, weapons 25%,
+# armor 15%, split evenly within each category
+_LOOT = _CONSUMABLES + _WEAPONS + _ARMORS
+_LOOT_CUM_WEIGHTS = tuple(itertools.accumulate(
+    [60 / len(_CONSUMABLES)] * len(_CONSUMABLES)
+    + [25 / len(_WEAPONS)] * len(_WEAPONS)
+    + [15 / len(_ARMORS)] * len(_ARMORS)
+))
+
+
 def get_random_weapon() -> Item:
     """Get a random weapon."""
-    import random
-    weapons = [k for k, v in ITEMS.items() if v.item_type == ItemType.WEAPON and k != "fists"]
-    return create_item(random.choice(weapons))
+    return random.choice(_WEAPONS).copy()
 
 
 def get_random_armor() -> Item:
     """Get a random armor piece."""
-    import random
-    armors = [k for k, v in ITEMS.items() if v.item_type == ItemType.ARMOR]
-    return create_item(random.choice(armors))
+    return random.choice(_ARMORS).copy()
 
 
 def get_random_consumable() -> Item:
     """Get a random consumable."""
-    import random
-    consumables = [k for k, v in ITEMS.items() if v.item_type == ItemType.CONSUMABLE]
-    return create_item(random.choice(consumables))
+    return random.choice(_CONSUMABLES).copy()
 
 
-def get_random_item() -> Item:
-    """Get a random item with weighted distribution."""
-    import random
+def get_random_item(rng: random.Random | None = None) -> Item:
+    """Get a random item with weighted distribution, rolled from rng if given."""
     # Consumables are more common than equipment
-    roll = random.randint(1, 100)
-    if roll <= 60:
-        return get_random_consumable()
-    elif roll <= 85:
-        return get_random_weapon()
-    else:
-        return get_random_armor()
+    choices = rng.choices if rng is not None else random.choices
+    return choices(_LOOT, cum_weights=_LOOT_CUM_WEIGHTS)[0].copy()
@@ -15,6 +15,7 @@ from src.map import tile as tile_types
 
 if TYPE_CHECKING:
     from src.graphics.tileset_manager import TilesetManager
+    from src.map.procgen import RectangularRoom
 
 
 class GameMap:
@@ -33,12 +34,22 @@ class GameMap:
         self.visible = np.full((width, height), fill_value=False, order="F")
         self.explored = np.full((width, height), fill_value=False, order="F")
 
-        # Tile type tracking for graphical rendering
-        # 0 = wall, 1 = floor (matches the tile type)
-        self.tile_types = np.zeros((width, height), dtype=np.int32, order="F")
+        # Kind of each tile (tile_types.WALL, FLOOR, ...), kept in step with tiles
+        # by set_tile so lookups compare one byte instead of a whole tile record
+        self.tile_types = np.full((width, height), fill_value=tile_types.WALL, dtype=np.uint8, order="F")
 
         # Rooms list (for spawning)
-        self.rooms: list = []
+        self.rooms: list[RectangularRoom] = []
+
+        # Offscreen copy of the drawn map, redrawn only when FOV or tiles change
+        self._layer = tcod.console.Console(width, height, order="F")
+        self._layer.rgb["fg"] = 0  # Start as unexplored: black spaces on black
+        self._layer_dirty = True
+        # Terrain codepoints (floor, wall, door_closed, door_open), looked up on first draw
+        self._terrain_glyphs: tuple[int, int, int | None, int | None] | None = None
+
+        # (x, y, radius) of the last FOV computed, reset whenever transparency changes
+        self._fov_key: tuple[int, int, int] | None = None
 
     @property
     def walkable(self) -> np.ndarray:
@@ -56,77 +67,127 @@ class GameMap:
 
     def compute_fov(self, x: int, y: int, radius: int = 8) -> None:
         """Compute the field of view from position (x, y)."""
-        self.visible[:] = tcod.map.compute_fov(
+        key = (x, y, radius)
+        if key == self._fov_key:
+            return  # Same viewpoint over the same tiles, visible is still current
+        self._fov_key = key
+
+        visible = tcod.map.compute_fov(
             self.transparent,
             (x, y),
             radius=radius,
             algorithm=libtcodpy.FOV_SYMMETRIC_SHADOWCAST,
         )
+        if np.array_equal(visible, self.visible):
+            return  # Nothing new seen, the drawn layer is still valid
+        self.visible[:] = visible
         # Mark visible tiles as explored
         self.explored |= self.visible
+        self._layer_dirty = True
+
+    def set_tile(self, where, kind: int) -> None:
+        """Set the tiles at where (an (x, y) pair, slices or a mask) to a tile kind."""
+        self.tiles[where] = tile_types.TILES_BY_KIND[kind]
+        self.tile_types[where] = kind
 
     def is_door_closed(self, x: int, y: int) -> bool:
         """Return True if the tile is a closed door."""
-        return np.array_equal(self.tiles[x, y], tile_types.door_closed)
+        return self.tile_types[x, y] == tile_types.DOOR_CLOSED
 
     def is_door_open(self, x: int, y: int) -> bool:
         """Return True if the tile is an open door."""
-        return np.array_equal(self.tiles[x, y], tile_types.door_open)
+        return self.tile_types[x, y] == tile_types.DOOR_OPEN
 
     def open_door(self, x: int, y: int) -> bool:
         """Open a closed door tile and return True if it changed."""
         if self.is_door_closed(x, y):
-            self.tiles[x, y] = tile_types.door_open
+            self.set_tile((x, y), tile_types.DOOR_OPEN)
+            self._layer_dirty = True
+            self._fov_key = None
             return True
         return False
 
     def close_door(self, x: int, y: int) -> bool:
         """Close an open door tile and return True if it changed."""
         if self.is_door_open(x, y):
-            self.tiles[x, y] = tile_types.door_closed
+            self.set_tile((x, y), tile_types.DOOR_CLOSED)
+            self._layer_dirty = True
+            self._fov_key = None
             return True
         return False
 
     def render(self, console: tcod.console.Console, tileset_manager: TilesetManager | None = None) -> None:
         """
         Render the map to the console using DawnLike tiles.
+
+        The map is drawn into an offscreen layer that is only redrawn after the
+        FOV or a door changes; every other frame just blits the cached layer.
         """
         if tileset_manager is None:
             return
 
-        # Get tile codepoints
-        floor_tile = tileset_manager.get_terrain_tile("floor")
-        wall_tile = tileset_manager.get_terrain_tile("wall")
-        door_closed_tile = tileset_manager.get_terrain_tile("door_closed")
-        door_open_tile = tileset_manager.get_terrain_tile("door_open")
+        if self._layer_dirty:
+            if not self._draw_layer(self._layer, tileset_manager):
+                return
+            self._layer_dirty = False
+        self._layer.blit(console)
 
-        if floor_tile is None or wall_tile is None:
-            print("ERROR: Terrain tiles not loaded!")
-            return
+    def _draw_layer(self, console: tcod.console.Console, tileset_manager: TilesetManager) -> bool:
+        """
+        Draw the map tiles to the layer console. Returns False if tiles are missing.
+        Tiles outside the explored area are left as last drawn.
+        """
 
-        # Render each tile with proper lighting
-        for x in range(self.width):
-            for y in range(self.height):
-                if not self.explored[x, y]:
-                    # Unexplored - show nothing (black)
-                    console.print(x, y, " ", fg=(0, 0, 0), bg=(0, 0, 0))
-                elif self.visible[x, y]:
-                    # Visible - show tile in full brightness
-                    if self.is_door_closed(x, y) and door_closed_tile is not None:
-                        console.print(x, y, chr(door_closed_tile), fg=(255, 255, 255), bg=(20, 20, 20))
-                    elif self.is_door_open(x, y) and door_open_tile is not None:
-                        console.print(x, y, chr(door_open_tile), fg=(255, 255, 255), bg=(20, 20, 20))
-                    elif self.tiles[x, y]["walkable"]:
-                        console.print(x, y, chr(floor_tile), fg=(255, 255, 255), bg=(20, 20, 20))
-                    else:
-                        console.print(x, y, chr(wall_tile), fg=(255, 255, 255), bg=(40, 40, 40))
-                else:
-                    # Explored but not visible - show darker
-                    if self.is_door_closed(x, y) and door_closed_tile is not None:
-                        console.print(x, y, chr(door_closed_tile), fg=(100, 100, 100), bg=(10, 10, 10))
-                    elif self.is_door_open(x, y) and door_open_tile is not None:
-                        console.print(x, y, chr(door_open_tile), fg=(100, 100, 100), bg=(10, 10, 10))
-                    elif self.tiles[x, y]["walkable"]:
-                        console.print(x, y, chr(floor_tile), fg=(100, 100, 100), bg=(10, 10, 10))
-                    else:
-                        console.print(x, y, chr(wall_tile), fg=(100, 100, 100), bg=(20, 20, 20))
+        # Get tile codepoints
+        if self._terrain_glyphs is None:
+            floor_tile = tileset_manager.get_terrain_tile("floor")
+            wall_tile = tileset_manager.get_terrain_tile("wall")
+            if floor_tile is None or wall_tile is None:
+                print("ERROR: Terrain tiles not loaded!")
+                return False
+            self._terrain_glyphs = (
+                floor_tile,
+                wall_tile,
+                tileset_manager.get_terrain_tile("door_closed"),
+                tileset_manager.get_terrain_tile("door_open"),
+            )
+        floor_tile, wall_tile, door_closed_tile, door_open_tile = self._terrain_glyphs
+
+        # A map's explored area only grows, so everything outside its bounding box
+        # is still the unexplored black drawn before; only the box is redrawn
+        explored = self.explored
+        cols = np.flatnonzero(explored.any(axis=1))
+        if cols.size == 0:
+            return True
+        rows = np.flatnonzero(explored.any(axis=0))
+        box = (slice(cols[0], cols[-1] + 1), slice(rows[0], rows[-1] + 1))
+        kinds = self.tile_types[box]
+
+        # Pick each tile's glyph; doors without a tile fall through to floor/wall
+        masks = []
+        glyphs = []
+        if door_closed_tile is not None:
+            masks.append(kinds == tile_types.DOOR_CLOSED)
+            glyphs.append(door_closed_tile)
+        if door_open_tile is not None:
+            masks.append(kinds == tile_types.DOOR_OPEN)
+            glyphs.append(door_open_tile)
+        masks.append(self.walkable[box])
+        glyphs.append(floor_tile)
+        ch = np.select(masks, glyphs, default=wall_tile)
+        is_wall = ~np.logical_or.reduce(masks)
+
+        # Visible tiles in full brightness, explored ones darker, unexplored black.
+        # Every colour is a grey, so one channel is computed and broadcast to RGB.
+        visible = self.visible[box]
+        explored = explored[box]
+        fg = np.where(visible, 255, 100)
+        bg = np.where(visible, np.where(is_wall, 40, 20), np.where(is_wall, 20, 10))
+        fg[~explored] = 0
+        bg[~explored] = 0
+
+        cells = console.rgb[box]
+        cells["ch"] = np.where(explored, ch, ord(" "))
+        cells["fg"] = fg[..., np.newaxis]
+        cells["bg"] = bg[..., np.newaxis]
+        return True
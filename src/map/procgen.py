@@ -5,7 +5,6 @@ Procedural map generation
 from __future__ import annotations
 
 import random
-import numpy as np
 from typing import Iterator
 
 import tcod
@@ -48,14 +47,16 @@ class RectangularRoom:
 def tunnel_between(
     start: tuple[int, int],
     end: tuple[int, int],
+    rng: random.Random | None = None,
 ) -> Iterator[tuple[int, int]]:
     """
-    Return an L-shaped tunnel between two points.
+    Return an L-shaped tunnel between two points, turning the corner as rng rolls.
     """
     x1, y1 = start
     x2, y2 = end
 
-    if random.random() < 0.5:
+    roll = rng.random if rng is not None else random.random
+    if roll() < 0.5:
         # Horizontal first, then vertical
         corner_x, corner_y = x2, y1
     else:
@@ -75,9 +76,10 @@ def generate_dungeon(
     max_rooms: int,
     room_min_size: int,
     room_max_size: int,
+    rng: random.Random | None = None,
 ) -> tuple[GameMap, int, int]:
     """
-    Generate a new dungeon map.
+    Generate a new dungeon map, rolling from rng if given.
 
     Returns:
         Tuple of (game_map, player_x, player_y)
@@ -86,12 +88,14 @@ def generate_dungeon(
 
     rooms: list[RectangularRoom] = []
 
+    randint = rng.randint if rng is not None else random.randint
+
     for _ in range(max_rooms):
-        room_width = random.randint(room_min_size, room_max_size)
-        room_height = random.randint(room_min_size, room_max_size)
+        room_width = randint(room_min_size, room_max_size)
+        room_height = randint(room_min_size, room_max_size)
 
-        x = random.randint(0, map_width - room_width - 1)
-        y = random.randint(0, map_height - room_height - 1)
+        x = randint(0, map_width - room_width - 1)
+        y = randint(0, map_height - room_height - 1)
 
         new_room = RectangularRoom(x, y, room_width, room_height)
 
@@ -100,12 +104,12 @@ def generate_dungeon(
             continue
 
         # Dig out the room
-        game_map.tiles[new_room.inner] = tile_types.floor
+        game_map.set_tile(new_room.inner, tile_types.FLOOR)
 
         if rooms:
             # Tunnel to previous room
-            for x, y in tunnel_between(rooms[-1].center, new_room.center):
-                game_map.tiles[x, y] = tile_types.floor
+            for x, y in tunnel_between(rooms[-1].center, new_room.center, rng):
+                game_map.set_tile((x, y), tile_types.FLOOR)
 
         rooms.append(new_room)
 
@@ -123,17 +127,19 @@ def generate_dungeon(
 def _place_doors(game_map: GameMap, rooms: list[RectangularRoom]) -> None:
     """Place closed doors at room entrances leading to corridors."""
 
+    kinds = game_map.tile_types
+
     def is_wall(x: int, y: int) -> bool:
-        return np.array_equal(game_map.tiles[x, y], tile_types.wall)
+        return kinds[x, y] == tile_types.WALL
 
     def is_floor(x: int, y: int) -> bool:
-        return np.array_equal(game_map.tiles[x, y], tile_types.floor)
+        return kinds[x, y] == tile_types.FLOOR
 
     def try_place_door(x: int, y: int, inside: tuple[int, int], outside: tuple[int, int]) -> None:
         if not game_map.in_bounds(*outside):
             return
         if is_wall(x, y) and is_floor(*inside) and is_floor(*outside):
-            game_map.tiles[x, y] = tile_types.door_closed
+            game_map.set_tile((x, y), tile_types.DOOR_CLOSED)
 
     for room in rooms:
         for x in range(room.x1 + 1, room.x2 - 1):
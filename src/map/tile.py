@@ -92,3 +92,13 @@ door_open = new_tile(
     dark=(ord('/'), (60, 40, 20), (0, 0, 0)),
     light=(ord('/'), (150, 110, 70), (0, 0, 0)),
 )
+
+
+# Kinds of tile the map tracks in its uint8 tile_types grid
+WALL = 0
+FLOOR = 1
+DOOR_CLOSED = 2
+DOOR_OPEN = 3
+
+# Tile data for each kind, indexed by the constants above
+TILES_BY_KIND = (wall, floor, door_closed, door_open)
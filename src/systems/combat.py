@@ -189,8 +189,8 @@ class Combat:
         dy = defender.y - attacker.y
 
         # Normalize to -1, 0, 1
-        push_x = 0 if dx == 0 else (1 if dx > 0 else -1)
-        push_y = 0 if dy == 0 else (1 if dy > 0 else -1)
+        push_x = (dx > 0) - (dx < 0)
+        push_y = (dy > 0) - (dy < 0)
 
         new_x = defender.x + push_x
         new_y = defender.y + push_y
@@ -199,8 +199,7 @@ class Combat:
         if game.game_map.walkable[new_x, new_y]:
             blocking = game._get_blocking_entity_at(new_x, new_y)
             if blocking is None:
-                defender.x = new_x
-                defender.y = new_y
+                game.move_entity(defender, new_x, new_y)
                 return True
 
         return False
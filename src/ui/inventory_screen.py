@@ -48,6 +48,15 @@ class InventoryScreen:
         self.max_visible_items = 15
         self.messages: list[tuple[str, tuple[int, int, int]]] = []
 
+    def reset(self, player: Player) -> None:
+        """Reopen the screen for a player, back at the top of the list."""
+        self.player = player
+        self.selected_index = 0
+        self.mode = InventoryMode.BROWSE
+        self.action_index = 0
+        self.scroll_offset = 0
+        self.messages.clear()
+
     def render(self, console: tcod.console.Console) -> None:
         """Render the inventory screen."""
         console.clear()